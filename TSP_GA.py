@@ -1,6 +1,6 @@
 import numpy as np
+import math
 import random
-from itertools import permutations
 import matplotlib.pyplot as plt
 
 class AlgoritmoGenetico:
@@ -9,18 +9,29 @@ class AlgoritmoGenetico:
                  tam_populacao=250, 
                  taxa_crossover=0.8, 
                  taxa_mutacao=0.2, 
-                 num_geracoes=200):
+                 num_geracoes=200,
+                 populacao_unica=False):
         self.nomes_cidades : list[str] = nomes_cidades
         self.coordenadas_cidades = coordenadas_cidades
         self.tam_populacao = tam_populacao
         self.taxa_crossover = taxa_crossover
         self.taxa_mutacao = taxa_mutacao
         self.num_geracoes = num_geracoes
+        self.populacao_unica = populacao_unica
 
     def gerar_populacao_inicial(self):
-        permutacoes_cidades = list(permutations(self.nomes_cidades))
-        indices_aleatorios = random.sample(range(len(permutacoes_cidades)), self.tam_populacao)
-        return [list(permutacoes_cidades[i]) for i in indices_aleatorios]
+        # Sorteia as permutações em lote, sem enumerar todas as n! possibilidades
+        num_cidades = len(self.nomes_cidades)
+        indices = np.argsort(np.random.random((self.tam_populacao, num_cidades)), axis=1)
+        if self.populacao_unica:
+            if math.factorial(num_cidades) < self.tam_populacao:
+                raise ValueError("Tamanho da população maior que o número de caminhos possíveis")
+            indices = np.unique(indices, axis=0)
+            while len(indices) < self.tam_populacao:
+                faltam = self.tam_populacao - len(indices)
+                extras = np.argsort(np.random.random((faltam, num_cidades)), axis=1)
+                indices = np.unique(np.concatenate((indices, extras)), axis=0)
+        return [[self.nomes_cidades[i] for i in linha] for linha in indices]
 
     def distancia_cidades(self, cidade1, cidade2):
         coord1 = self.coordenadas_cidades[cidade1]
@@ -1,5 +1,8 @@
 import os
 import csv
+import zlib
+import itertools
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 import numpy as np
 import matplotlib.pyplot as plt
@@ -7,6 +10,60 @@ import matplotlib.pyplot as plt
 from src.genetic_algorithm import AlgoritmoGenetico
 from src.visualization import plot_city_path
 
+def _simulation_seed(base_seed, config, run):
+    """
+    Deriva uma semente determinística para uma execução da varredura.
+    
+    Args:
+        base_seed (int): Semente base da varredura
+        config (tuple): Configuração do algoritmo genético
+        run (int): Número da rodada
+    
+    Returns:
+        int: Semente da execução
+    """
+    return zlib.crc32(repr((base_seed, config, run)).encode())
+
+def _run_simulation(city_names, city_coordinates, config, run, seed):
+    """
+    Executa uma rodada do algoritmo genético em um processo do pool.
+    
+    Args:
+        city_names (list): Nomes das cidades
+        city_coordinates (dict): Coordenadas das cidades
+        config (tuple): (população, crossover, mutação, gerações, seleção)
+        run (int): Número da rodada
+        seed (int): Semente da execução
+    
+    Returns:
+        tuple: Linha de resultado para o CSV e número de avaliações de fitness
+    """
+    pop_size, crossover_rate, mutation_rate, num_gen, selection_method = config
+    ga = AlgoritmoGenetico(
+        city_names, 
+        city_coordinates, 
+        population_size=pop_size,
+        crossover_rate=crossover_rate, 
+        mutation_rate=mutation_rate, 
+        generations=num_gen,
+        selection_method=selection_method,
+        seed=seed
+    )
+    
+    best_path, best_distance = ga.run()
+    
+    result = [
+        run, 
+        pop_size, 
+        crossover_rate, 
+        mutation_rate, 
+        num_gen, 
+        best_distance, 
+        ' -> '.join(best_path),
+        selection_method
+    ]
+    return result, ga.fitness_evaluations
+
 class GAPerformanceAnalyzer:
     def __init__(self, 
                  city_names, 
@@ -36,88 +93,308 @@ class GAPerformanceAnalyzer:
         population_sizes=[100, 250, 500],
         crossover_rates=[0.6, 0.8],
         mutation_rates=[0.1, 0.2],
-        generations=[100, 200, 300]
+        generations=[100, 200, 300],
+        selection_methods=['roulette'],
+        workers=None,
+        results_file=None,
+        base_seed=0
     ):
         """
         Executa múltiplas simulações com diferentes configurações.
         
+        As execuções são distribuídas em um pool de processos e cada resultado é
+        gravado no CSV assim que termina. Cada execução tem uma semente
+        determinística derivada da configuração e do número da rodada. Se
+        results_file já existir, as execuções registradas nele são puladas, o que
+        permite retomar uma varredura interrompida. Uma execução que falha é
+        informada e não interrompe as demais.
+        
         Args:
             population_sizes (list): Tamanhos de população a testar
             crossover_rates (list): Taxas de crossover a testar
             mutation_rates (list): Taxas de mutação a testar
             generations (list): Números de gerações a testar
+            selection_methods (list): Métodos de seleção a testar ('roulette', 'sus', 'tournament')
+            workers (int): Número de processos (None usa todos os núcleos)
+            results_file (str): CSV de resultados a criar ou retomar
+                (None cria um novo arquivo com timestamp)
+            base_seed (int): Semente base da varredura
         
         Returns:
             list: Resultados detalhados das simulações
+
+        Raises:
+            ValueError: Se results_file existir com um cabeçalho diferente do atual
         """
-        all_results = []
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        results_file = os.path.join(self.results_dir, f'ga_results_{timestamp}.csv')
+        if results_file is None:
+            results_file = os.path.join(self.results_dir, f'ga_results_{timestamp}.csv')
         
         # Cabeçalho do arquivo CSV
         headers = [
             'Run', 'Population Size', 'Crossover Rate', 'Mutation Rate', 
-            'Generations', 'Best Distance', 'Best Path'
+            'Generations', 'Best Distance', 'Best Path', 'Selection Method'
         ]
         
-        with open(results_file, 'w', newline='') as csvfile:
-            csvwriter = csv.writer(csvfile)
-            csvwriter.writerow(headers)
-            
-            # Contador para número total de simulações
-            total_simulations = (
-                len(population_sizes) * 
-                len(crossover_rates) * 
-                len(mutation_rates) * 
-                len(generations) * 
-                self.num_runs
+        # Só retoma arquivos com o cabeçalho atual, antes de iniciar qualquer execução
+        write_header = self._check_results_header(results_file, headers)
+        
+        # Execuções já registradas em uma varredura anterior
+        all_results = self._load_results(results_file)
+        done = {self._result_key(result) for result in all_results}
+        
+        pending = [
+            (config, run)
+            for config in itertools.product(
+                population_sizes, crossover_rates, mutation_rates, generations, selection_methods
             )
-            current_simulation = 0
+            for run in range(1, self.num_runs + 1)
+            if (*config, run) not in done
+        ]
+        total_simulations = len(done) + len(pending)
+        current_simulation = len(done)
+        
+        failed = []
+        with open(results_file, 'a', newline='') as csvfile:
+            csvwriter = csv.writer(csvfile)
+            if write_header:
+                csvwriter.writerow(headers)
             
-            # Testa todas as combinações
-            for pop_size in population_sizes:
-                for crossover_rate in crossover_rates:
-                    for mutation_rate in mutation_rates:
-                        for num_gen in generations:
-                            # Executa múltiplas rodadas para cada configuração
-                            for run in range(self.num_runs):
-                                current_simulation += 1
-                                print(f"Progresso: {current_simulation}/{total_simulations}")
-                                
-                                # Configura e roda o algoritmo genético
-                                ga = AlgoritmoGenetico(
-                                    self.city_names, 
-                                    self.city_coordinates, 
-                                    population_size=pop_size,
-                                    crossover_rate=crossover_rate, 
-                                    mutation_rate=mutation_rate, 
-                                    generations=num_gen
-                                )
-                                
-                                best_path, best_distance = ga.run()
-                                
-                                # Prepara resultado para salvar
-                                result = [
-                                    run + 1, 
-                                    pop_size, 
-                                    crossover_rate, 
-                                    mutation_rate, 
-                                    num_gen, 
-                                    best_distance, 
-                                    ' -> '.join(best_path)
-                                ]
-                                
-                                # Salva no CSV
-                                csvwriter.writerow(result)
-                                csvfile.flush()
-                                
-                                all_results.append(result)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(
+                        _run_simulation,
+                        self.city_names,
+                        self.city_coordinates,
+                        config,
+                        run,
+                        _simulation_seed(base_seed, config, run)
+                    ): (config, run)
+                    for config, run in pending
+                }
+                for future in as_completed(futures):
+                    current_simulation += 1
+                    try:
+                        result, _ = future.result()
+                    except Exception as error:
+                        # Uma execução com erro não interrompe a varredura; por não
+                        # ser gravada, ela é repetida ao retomar o arquivo
+                        config, run = futures[future]
+                        failed.append((config, run))
+                        print(f"Execução {run} da configuração {config} falhou: {error!r}")
+                        continue
+                    print(f"Progresso: {current_simulation}/{total_simulations}")
+                    
+                    # Salva no CSV assim que a execução termina
+                    csvwriter.writerow(result)
+                    csvfile.flush()
+                    
+                    all_results.append(result)
+        
+        if failed:
+            print(f"{len(failed)} execução(ões) falharam e não foram gravadas em {results_file}")
+        if not all_results:
+            return all_results
         
         # Gera visualizações
         self._generate_performance_plots(all_results, timestamp)
         
         return all_results
 
+    def tune_parameters(
+        self,
+        population_sizes=[100, 250, 500],
+        crossover_rates=[0.6, 0.8],
+        mutation_rates=[0.1, 0.2],
+        generations=[100, 200, 300],
+        selection_methods=['roulette'],
+        initial_runs=3,
+        max_runs=None,
+        eta=3,
+        z=2.0,
+        workers=None,
+        base_seed=0
+    ):
+        """
+        Ajusta os parâmetros por successive halving com corrida estatística.
+        
+        Cada configuração recebe inicialmente initial_runs execuções. A cada
+        rodada são descartadas as configurações estatisticamente piores que a
+        melhor (média maior que a da melhor por mais de z erros-padrão, somados)
+        e mantida apenas a melhor fração 1/eta; as sobreviventes recebem eta vezes
+        mais execuções, até max_runs. As execuções já feitas são reaproveitadas e
+        usam as mesmas sementes de run_multiple_simulations. Uma configuração
+        com alguma execução que falha é informada e deixa a corrida.
+        
+        Args:
+            population_sizes (list): Tamanhos de população a testar
+            crossover_rates (list): Taxas de crossover a testar
+            mutation_rates (list): Taxas de mutação a testar
+            generations (list): Números de gerações a testar
+            selection_methods (list): Métodos de seleção a testar
+            initial_runs (int): Execuções por configuração na primeira rodada
+            max_runs (int): Máximo de execuções por configuração (padrão: num_runs)
+            eta (int): Fator de redução de configurações e de aumento de execuções
+            z (float): Número de erros-padrão usado para descartar configurações
+            workers (int): Número de processos (None usa todos os núcleos)
+            base_seed (int): Semente base das execuções
+        
+        Returns:
+            dict: Parâmetros escolhidos, distância média, execuções e avaliações gastas
+
+        Raises:
+            RuntimeError: Se todas as configurações falharem
+        """
+        if eta < 2:
+            raise ValueError("eta deve ser pelo menos 2")
+        max_runs = self.num_runs if max_runs is None else max_runs
+        
+        configs = list(itertools.product(
+            population_sizes, crossover_rates, mutation_rates, generations, selection_methods
+        ))
+        distances = {config: [] for config in configs}
+        total_evaluations = 0
+        total_runs = 0
+        runs = min(initial_runs, max_runs)
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            while True:
+                futures = {
+                    executor.submit(
+                        _run_simulation,
+                        self.city_names,
+                        self.city_coordinates,
+                        config,
+                        run,
+                        _simulation_seed(base_seed, config, run)
+                    ): (config, run)
+                    for config in configs
+                    for run in range(len(distances[config]) + 1, runs + 1)
+                }
+                failed = set()
+                for future in as_completed(futures):
+                    config, run = futures[future]
+                    try:
+                        result, evaluations = future.result()
+                    except Exception as error:
+                        # A configuração com erro deixa a corrida; as demais continuam
+                        failed.add(config)
+                        print(f"Execução {run} da configuração {config} falhou: {error!r}")
+                        continue
+                    distances[config].append(result[5])
+                    total_evaluations += evaluations
+                    total_runs += 1
+                
+                configs = [config for config in configs if config not in failed]
+                if not configs:
+                    raise RuntimeError("Todas as configurações da corrida falharam")
+                means = {config: np.mean(distances[config]) for config in configs}
+                errors = {
+                    config: np.std(distances[config], ddof=1) / np.sqrt(runs) if runs > 1 else 0.0
+                    for config in configs
+                }
+                best = min(configs, key=means.get)
+                print(f"Execuções por configuração: {runs}, configurações restantes: {len(configs)}")
+                if len(configs) == 1 or runs >= max_runs:
+                    break
+                
+                # Corrida: descarta as configurações estatisticamente piores que a melhor
+                configs = [
+                    config for config in configs
+                    if means[config] - z * errors[config] <= means[best] + z * errors[best]
+                ]
+                # Successive halving: mantém apenas a melhor fração 1/eta
+                configs = sorted(configs, key=means.get)[:max(1, int(np.ceil(len(configs) / eta)))]
+                runs = min(runs * eta, max_runs)
+        
+        pop_size, crossover_rate, mutation_rate, num_gen, selection_method = best
+        summary = {
+            'Population Size': pop_size,
+            'Crossover Rate': crossover_rate,
+            'Mutation Rate': mutation_rate,
+            'Generations': num_gen,
+            'Selection Method': selection_method,
+            'Mean Distance': float(means[best]),
+            'Runs': len(distances[best]),
+            'Total GA Runs': total_runs,
+            'Total Fitness Evaluations': total_evaluations
+        }
+        print("Parâmetros escolhidos:", summary)
+        return summary
+
+    @staticmethod
+    def _result_key(result):
+        """
+        Identifica a configuração e a rodada de um resultado.
+        
+        Args:
+            result (list): Linha de resultado
+        
+        Returns:
+            tuple: (população, crossover, mutação, gerações, seleção, rodada)
+        """
+        run, pop_size, crossover_rate, mutation_rate, num_gen = result[:5]
+        return (pop_size, crossover_rate, mutation_rate, num_gen, result[7], run)
+
+    @staticmethod
+    def _check_results_header(results_file, headers):
+        """
+        Verifica se um CSV de resultados existente pode ser retomado.
+        
+        Arquivos com outro cabeçalho (por exemplo, os anteriores à coluna de
+        seleção) são recusados: as linhas novas ficariam sob colunas erradas e
+        não seriam reconhecidas como feitas ao retomar.
+        
+        Args:
+            results_file (str): Caminho do CSV
+            headers (list): Cabeçalho esperado
+        
+        Returns:
+            bool: True se o arquivo não existe ou está vazio e o cabeçalho deve ser escrito
+        
+        Raises:
+            ValueError: Se o cabeçalho do arquivo for diferente de headers
+        """
+        if not os.path.exists(results_file) or os.path.getsize(results_file) == 0:
+            return True
+        with open(results_file, newline='') as csvfile:
+            header = next(csv.reader(csvfile), [])
+        if header != headers:
+            raise ValueError(
+                f"{results_file} tem o cabeçalho {header}, diferente do atual {headers}; "
+                "use outro results_file"
+            )
+        return False
+
+    @staticmethod
+    def _load_results(results_file):
+        """
+        Lê os resultados já gravados em um CSV de varredura.
+        
+        Args:
+            results_file (str): Caminho do CSV
+        
+        Returns:
+            list: Resultados no mesmo formato das linhas gravadas
+        """
+        if not os.path.exists(results_file):
+            return []
+        
+        results = []
+        with open(results_file, newline='') as csvfile:
+            for row in csv.DictReader(csvfile):
+                results.append([
+                    int(row['Run']),
+                    int(row['Population Size']),
+                    float(row['Crossover Rate']),
+                    float(row['Mutation Rate']),
+                    int(row['Generations']),
+                    float(row['Best Distance']),
+                    row['Best Path'],
+                    row['Selection Method']
+                ])
+        return results
+
     def _generate_performance_plots(self, results, timestamp):
         """
         Gera gráficos de análise de desempenho.
@@ -176,7 +453,8 @@ def main():
         population_sizes=[100, 250, 500],
         crossover_rates=[0.6, 0.8],
         mutation_rates=[0.1, 0.2],
-        generations=[100, 200, 300]
+        generations=[100, 200, 300],
+        selection_methods=['roulette', 'tournament']
     )
 
     # Sumário dos resultados
@@ -0,0 +1,265 @@
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import tracemalloc
+from datetime import datetime
+import numpy as np
+
+from src.genetic_algorithm import AlgoritmoGenetico
+from src.tsplib import carregar_tsp, carregar_tour
+
+# Instância de demonstração usada em main.py e automatic.py
+DEMO_CITY_NAMES = ["Gliwice", "Cairo", "Rome", "Krakow", "Paris",
+                   "Alexandria", "Berlin", "Tokyo", "Rio", "Budapest"]
+DEMO_COORDINATES = [
+    (0, 1), (3, 2), (6, 1), (7, 4.5), (15, -1),
+    (10, 2.5), (16, 11), (5, 6), (8, 9), (1.5, 12)
+]
+# Ótimo da instância de demonstração, obtido por enumeração exaustiva
+DEMO_OPTIMUM = 61.13744551656403
+
+# Métricas comparadas pelo comando compare: (chave, True se maior é melhor)
+METRICAS_COMPARADAS = [
+    ('generations_per_sec', True),
+    ('evaluations_per_sec', True),
+    ('peak_memory_bytes', False),
+    ('best_distance', False),
+]
+
+def instancias_padrao(sizes):
+    """
+    Monta o conjunto fixo de instâncias do benchmark.
+
+    O tamanho 10 é a instância de demonstração (ótimo conhecido); os demais
+    são instâncias uniformes no quadrado [0, 1000]², geradas com semente fixa.
+
+    Args:
+        sizes (list): Números de cidades
+
+    Returns:
+        list: Dicionários com name, kwargs do AlgoritmoGenetico e optimum
+    """
+    instances = []
+    for size in sizes:
+        if size == 10:
+            instances.append({
+                'name': 'demo10',
+                'ga_kwargs': {'city_names': DEMO_CITY_NAMES,
+                              'city_coordinates': dict(zip(DEMO_CITY_NAMES, DEMO_COORDINATES))},
+                'optimum': DEMO_OPTIMUM,
+            })
+        else:
+            coordinates = np.random.default_rng(size).random((size, 2)) * 1000
+            instances.append({
+                'name': f'uniform{size}',
+                'ga_kwargs': {'city_names': [str(i + 1) for i in range(size)],
+                              'city_coordinates': coordinates},
+                'optimum': None,
+            })
+    return instances
+
+def instancia_tsplib(path):
+    """
+    Monta uma instância do benchmark a partir de um arquivo .tsp.
+
+    O ótimo é calculado a partir do arquivo .opt.tour de mesmo nome, se existir.
+
+    Args:
+        path (str): Caminho do arquivo .tsp
+
+    Returns:
+        dict: Dicionário com name, kwargs do AlgoritmoGenetico e optimum
+    """
+    instance = carregar_tsp(path)
+    ga_kwargs = instance.parametros_ga()
+    optimum = None
+    tour_path = os.path.splitext(path)[0] + '.opt.tour'
+    if os.path.exists(tour_path):
+        ga = AlgoritmoGenetico(**ga_kwargs)
+        optimum = float(ga.distancia(carregar_tour(tour_path)))
+    return {'name': instance.name or os.path.basename(path), 'ga_kwargs': ga_kwargs,
+            'optimum': optimum}
+
+def executar_caso(instance, seed, generations, ga_params):
+    """
+    Executa o algoritmo sobre uma instância e mede vazão, memória e qualidade.
+
+    A vazão é medida numa execução sem tracemalloc; o pico de memória, numa
+    segunda execução curta com tracemalloc ativo (o pico ocorre já nas
+    primeiras gerações e o rastreamento distorceria os tempos).
+
+    Args:
+        instance (dict): Instância do benchmark
+        seed (int): Semente do algoritmo
+        generations (int): Número de gerações
+        ga_params (dict): Demais parâmetros do AlgoritmoGenetico
+
+    Returns:
+        dict: Resultado do caso
+    """
+    optimum = instance['optimum']
+
+    def gap(distance):
+        return None if optimum is None else (distance - optimum) / optimum
+
+    ga = AlgoritmoGenetico(generations=generations, seed=seed,
+                           **instance['ga_kwargs'], **ga_params)
+    start = time.perf_counter()
+    ga.iniciar()
+    best = float(np.min(ga.distances))
+    trajectory = [[time.perf_counter() - start, best, gap(best)]]
+    for _ in range(generations):
+        ga.evoluir_geracao()
+        current = float(np.min(ga.distances))
+        if current < best:
+            best = current
+            trajectory.append([time.perf_counter() - start, best, gap(best)])
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    memory_ga = AlgoritmoGenetico(generations=generations, seed=seed,
+                                  **instance['ga_kwargs'], **ga_params)
+    memory_ga.iniciar()
+    for _ in range(min(generations, 5)):
+        memory_ga.evoluir_geracao()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'instance': instance['name'],
+        'n_cities': len(ga.city_names),
+        'seed': seed,
+        'generations': generations,
+        'elapsed_sec': elapsed,
+        'generations_per_sec': generations / elapsed,
+        'evaluations_per_sec': ga.fitness_evaluations / elapsed,
+        'fitness_evaluations': ga.fitness_evaluations,
+        'peak_memory_bytes': peak,
+        'engine_memory_bytes': ga.bytes_memoria()['total'],
+        'best_distance': best,
+        'optimum': optimum,
+        'gap': gap(best),
+        'trajectory': trajectory,
+    }
+
+def executar_benchmark(instances, seeds, generations, ga_params):
+    """
+    Executa todos os casos (instância x semente) do benchmark.
+
+    Args:
+        instances (list): Instâncias do benchmark
+        seeds (list): Sementes
+        generations (int): Número de gerações de cada caso
+        ga_params (dict): Demais parâmetros do AlgoritmoGenetico
+
+    Returns:
+        dict: Metadados do ambiente e resultados de cada caso
+    """
+    results = []
+    for instance in instances:
+        for seed in seeds:
+            result = executar_caso(instance, seed, generations, ga_params)
+            results.append(result)
+            gap = '-' if result['gap'] is None else f"{100 * result['gap']:.2f}%"
+            print(f"{result['instance']:>14} seed={seed:<3} "
+                  f"{result['generations_per_sec']:9.1f} ger/s "
+                  f"{result['evaluations_per_sec']:11.0f} aval/s "
+                  f"{result['peak_memory_bytes'] / 2**20:8.2f} MiB "
+                  f"melhor={result['best_distance']:.3f} gap={gap}")
+    return {
+        'metadata': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'generations': generations,
+            'seeds': list(seeds),
+            'ga_params': ga_params,
+        },
+        'results': results,
+    }
+
+def _medianas_por_instancia(report):
+    """Agrupa os resultados por instância, tomando a mediana entre as sementes."""
+    grouped = {}
+    for result in report['results']:
+        grouped.setdefault(result['instance'], []).append(result)
+    return {
+        name: {key: float(np.median([r[key] for r in results])) for key, _ in METRICAS_COMPARADAS}
+        for name, results in grouped.items()
+    }
+
+def comparar(baseline, current, tolerance=0.10):
+    """
+    Compara dois relatórios e aponta regressões por instância.
+
+    Cada métrica é comparada pela mediana entre sementes; uma piora relativa
+    maior que tolerance é marcada como regressão.
+
+    Args:
+        baseline (dict): Relatório de referência
+        current (dict): Relatório atual
+        tolerance (float): Piora relativa tolerada
+
+    Returns:
+        list: Linhas (instância, métrica, referência, atual, variação relativa, regressão)
+    """
+    base_medians = _medianas_por_instancia(baseline)
+    current_medians = _medianas_por_instancia(current)
+    rows = []
+    for name in sorted(set(base_medians) & set(current_medians)):
+        for key, higher_is_better in METRICAS_COMPARADAS:
+            before, after = base_medians[name][key], current_medians[name][key]
+            change = (after - before) / before if before else 0.0
+            worse = -change if higher_is_better else change
+            rows.append((name, key, before, after, change, worse > tolerance))
+    return rows
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark do Algoritmo Genético para o TSP")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help="Executa o benchmark e grava o relatório JSON")
+    run_parser.add_argument('--sizes', type=int, nargs='+', default=[10, 100, 1000])
+    run_parser.add_argument('--seeds', type=int, nargs='+', default=[0, 1, 2])
+    run_parser.add_argument('--generations', type=int, default=100)
+    run_parser.add_argument('--population', type=int, default=250)
+    run_parser.add_argument('--tsplib', nargs='*', default=[], help="Arquivos .tsp adicionais")
+    run_parser.add_argument('--output', default=None)
+
+    compare_parser = commands.add_parser('compare', help="Compara um relatório com a referência")
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--tolerance', type=float, default=0.10)
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        instances = instancias_padrao(args.sizes) + [instancia_tsplib(p) for p in args.tsplib]
+        report = executar_benchmark(instances, args.seeds, args.generations,
+                                    {'population_size': args.population})
+        output = args.output or os.path.join(
+            'benchmark_results', f"benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+        os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+        with open(output, 'w') as file:
+            json.dump(report, file, indent=2)
+        print(f"Relatório salvo em {output}")
+        return 0
+
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+    with open(args.current) as file:
+        current = json.load(file)
+    rows = comparar(baseline, current, args.tolerance)
+    for name, key, before, after, change, regression in rows:
+        flag = 'REGRESSÃO' if regression else ''
+        print(f"{name:>14} {key:>20} {before:14.3f} {after:14.3f} {100 * change:+8.1f}% {flag}")
+    regressions = sum(row[5] for row in rows)
+    print(f"{regressions} regressão(ões) acima de {100 * args.tolerance:.0f}%")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
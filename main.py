@@ -1,4 +1,4 @@
-from src.genetic_algorithm import TravelingSalesmanGeneticAlgorithm
+from src.solver import resolver_tsp
 from src.visualization import plot_city_path
 
 def main():
@@ -11,19 +11,18 @@ def main():
     ]
     city_coordinates = dict(zip(city_names, coordinates))
 
-    # Configuração do Algoritmo Genético
-    ga = TravelingSalesmanGeneticAlgorithm(
+    # Instâncias pequenas são resolvidas de forma exata (Held-Karp); as maiores,
+    # pelo Algoritmo Genético com a configuração abaixo
+    best_path, best_distance = resolver_tsp(
         city_names, 
         city_coordinates, 
+        exact_threshold=16,
         population_size=250,
         crossover_rate=0.8, 
         mutation_rate=0.2, 
         generations=200
     )
 
-    # Executa o algoritmo
-    best_path, best_distance = ga.run()
-
     # Imprime resultados
     print("Best path:", best_path)
     print("Shortest distance:", best_distance)
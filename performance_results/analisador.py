@@ -1,256 +1,385 @@
+import os
+import sys
 import csv
+import math
+import heapq
+import hashlib
+import argparse
 from collections import Counter
 import matplotlib.pyplot as plt
 import numpy as np
 
-def process_csv_and_plot(file_path):
-    # Inicializa variáveis para armazenar resultados
-    distances_with_paths = []
-    city_counter = Counter()
-    
-    # Lê o arquivo CSV
-    with open(file_path, mode='r', encoding='utf-8') as csv_file:
-        reader = csv.DictReader(csv_file)
-        
-        for row in reader:
-            # Obtém a distância e o caminho
-            distance = float(row['Best Distance'])
-            path = row['Best Path'].split(" -> ")
-            
-            # Atualiza o contador de cidades
-            city_counter.update(path)
-            
-            # Armazena a distância e o caminho
-            distances_with_paths.append((distance, path))
-    
-    # Ordena as distâncias para facilitar a análise
-    distances_with_paths.sort(key=lambda x: x[0])
-    
-    # Calcula menor, maior e mediana das distâncias
-    distances = [d[0] for d in distances_with_paths]
-    min_distance = distances[0]
-    max_distance = distances[-1]
-    median_distance = np.median(distances)
-    
-    # Gera gráficos
-    plt.figure(figsize=(8, 6))
-    
-    # Gráfico de barras: Menor, Maior e Mediana
-    labels = ['Menor Distância', 'Maior Distância', 'Mediana']
-    values = [min_distance, max_distance, median_distance]
-    plt.bar(labels, values, color=['green', 'red', 'blue'])
-    plt.title('Análise de Distâncias')
-    plt.ylabel('Distância')
-    plt.xlabel('Categorias')
-    
-    # Exibe o gráfico
-    plt.tight_layout()
-    plt.show()
-    
-    return distances_with_paths
-def process_csv_with_plots(file_path):
-    # Inicializa variáveis para armazenar resultados
-    min_distance = float('inf')
-    max_distance = float('-inf')
-    min_distance_path = []
-    max_distance_path = []
-    city_counter = Counter()
-    run_distances = []
-    run_labels = []
-    
-    # Lê o arquivo CSV
-    with open(file_path, mode='r', encoding='utf-8') as csv_file:
-        reader = csv.DictReader(csv_file)
-        
+# Permite importar o pacote src ao executar o script de dentro de performance_results
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.canonical_tour import forma_canonica_nomes
+
+# Colunas que identificam a configuração de uma execução na varredura
+COLUNAS_CONFIGURACAO = ['Population Size', 'Crossover Rate', 'Mutation Rate',
+                        'Generations', 'Selection Method']
+
+class QuantisFluxo:
+    """
+    Quantis de um fluxo de valores.
+
+    Enquanto houver até max_distinct valores distintos, guarda a contagem
+    exata de cada um e os quantis são exatos (mesma interpolação linear de
+    numpy.quantile), o que cobre as varreduras usuais, com muitos empates no
+    ótimo. Acima disso passa a um sketch KLL (Karnin, Lang e Liberty), com
+    memória O(k) e erro de posto da ordem de 1/k.
+    """
+    def __init__(self, max_distinct=10000, k=200, seed=0):
+        """
+        Args:
+            max_distinct (int): Valores distintos contados exatamente
+            k (int): Capacidade do maior compactador do sketch KLL
+            seed (int): Semente dos sorteios das compactações
+        """
+        self.max_distinct = max_distinct
+        self.k = k
+        self.rng = np.random.default_rng(seed)
+        self.counts = Counter()
+        # Compactadores do KLL: um item do nível h representa 2^h observações
+        self.compactors = None
+        self.size = 0
+
+    def atualizar(self, value):
+        """
+        Incorpora uma observação.
+
+        Args:
+            value (float): Valor observado
+        """
+        if self.compactors is None:
+            self.counts[value] += 1
+            if len(self.counts) > self.max_distinct:
+                counts, self.counts = self.counts, Counter()
+                self.compactors = [[]]
+                for item, count in counts.items():
+                    for _ in range(count):
+                        self._inserir(item)
+            return
+        self._inserir(value)
+
+    def _capacidade(self, level):
+        depth = len(self.compactors) - level - 1
+        return int(math.ceil(self.k * (2 / 3) ** depth)) + 1
+
+    def _inserir(self, value):
+        self.compactors[0].append(value)
+        self.size += 1
+        if self.size >= sum(self._capacidade(h) for h in range(len(self.compactors))):
+            self._compactar()
+
+    def _compactar(self):
+        """Compacta o primeiro nível cheio: ordena e promove metade dos itens."""
+        for level, compactor in enumerate(self.compactors):
+            if len(compactor) >= self._capacidade(level):
+                if level + 1 == len(self.compactors):
+                    self.compactors.append([])
+                compactor.sort()
+                # Um item fica no nível se a quantidade for ímpar
+                leftover = [compactor.pop()] if len(compactor) % 2 else []
+                offset = int(self.rng.integers(2))
+                self.compactors[level + 1].extend(compactor[offset::2])
+                self.size -= len(compactor) - len(compactor) // 2
+                compactor[:] = leftover
+                return
+
+    def quantil(self, p):
+        """
+        Args:
+            p (float): Quantil desejado, entre 0 e 1
+
+        Returns:
+            float: Quantil (exato enquanto houver até max_distinct valores distintos)
+        """
+        if self.compactors is None:
+            if not self.counts:
+                return math.nan
+            values = sorted(self.counts)
+            cumulative = np.cumsum([self.counts[value] for value in values])
+            position = (cumulative[-1] - 1) * p
+            lower = values[int(np.searchsorted(cumulative, math.floor(position), side='right'))]
+            upper = values[int(np.searchsorted(cumulative, math.ceil(position), side='right'))]
+            return lower + (upper - lower) * (position - math.floor(position))
+        items = sorted((value, 2 ** level)
+                       for level, compactor in enumerate(self.compactors) for value in compactor)
+        cumulative = np.cumsum([weight for _, weight in items])
+        index = int(np.searchsorted(cumulative, p * cumulative[-1], side='left'))
+        return items[min(index, len(items) - 1)][0]
+
+class EstatisticasGrupo:
+    """
+    Contagem, média, desvio padrão (Welford), mínimo e máximo em fluxo.
+    """
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+
+    def atualizar(self, value):
+        """
+        Incorpora uma observação.
+
+        Args:
+            value (float): Valor observado
+        """
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+
+    def desvio_padrao(self):
+        """
+        Returns:
+            float: Desvio padrão amostral (0 com menos de duas observações)
+        """
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+class ContagemDistintos:
+    """
+    Número de elementos distintos em fluxo com memória limitada (K-Minimum
+    Values): guarda apenas os k menores hashes de 64 bits vistos.
+
+    Com até k elementos distintos a contagem é exata; acima disso é estimada
+    por (k - 1) / (k-ésimo menor hash / 2^64), com erro relativo da ordem de
+    1 / sqrt(k).
+    """
+    def __init__(self, k=4096):
+        """
+        Args:
+            k (int): Número de hashes guardados
+        """
+        self.k = k
+        # Heap de máximo (hashes negados) dos k menores hashes e o conjunto deles
+        self.heap = []
+        self.members = set()
+
+    def adicionar(self, value):
+        """
+        Incorpora um elemento.
+
+        Args:
+            value (str): Elemento observado
+        """
+        digest = int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), 'little')
+        if digest in self.members:
+            return
+        if len(self.heap) < self.k:
+            heapq.heappush(self.heap, -digest)
+            self.members.add(digest)
+        elif digest < -self.heap[0]:
+            self.members.discard(-heapq.heappushpop(self.heap, -digest))
+            self.members.add(digest)
+
+    def valor(self):
+        """
+        Returns:
+            int: Número (exato ou estimado) de elementos distintos
+        """
+        if len(self.heap) < self.k:
+            return len(self.heap)
+        return round((self.k - 1) * 2**64 / -self.heap[0])
+
+class AgregadorResultados:
+    """
+    Agrega, em uma única passagem, as linhas de um CSV de resultados da
+    varredura (automatic.py).
+
+    Não guarda as linhas: apenas extremos, os quantis das distâncias (ver QuantisFluxo),
+    estatísticas por configuração, a contagem de cada cidade e um resumo de
+    tamanho fixo dos caminhos distintos. A memória cresce com o número de
+    configurações e de cidades, não com o de linhas. Caminhos que diferem
+    apenas por rotação ou sentido contam como a mesma solução.
+    """
+    def __init__(self):
+        self.rows = 0
+        self.min_distance, self.min_path = math.inf, []
+        self.max_distance, self.max_path = -math.inf, []
+        self.quantiles = QuantisFluxo()
+        self.overall = EstatisticasGrupo()
+        self.groups = {}
+        self.city_counter = Counter()
+        self.distinct_tours = ContagemDistintos()
+
+    def adicionar(self, distance, path, config):
+        """
+        Incorpora o resultado de uma execução.
+
+        Args:
+            distance (float): Melhor distância da execução
+            path (list): Melhor caminho (nomes das cidades)
+            config (tuple): Valores das colunas de configuração
+        """
+        self.rows += 1
+        if distance < self.min_distance:
+            self.min_distance, self.min_path = distance, path
+        if distance > self.max_distance:
+            self.max_distance, self.max_path = distance, path
+        self.quantiles.atualizar(distance)
+        self.overall.atualizar(distance)
+        if config not in self.groups:
+            self.groups[config] = EstatisticasGrupo()
+        self.groups[config].atualizar(distance)
+        self.city_counter.update(path)
+        self.distinct_tours.adicionar('\x1f'.join(forma_canonica_nomes(path)))
+
+    def cidades_mais_frequentes(self):
+        """
+        Returns:
+            tuple: Maior número de ocorrências e cidades que o atingem
+        """
+        if not self.city_counter:
+            return 0, []
+        count = self.city_counter.most_common(1)[0][1]
+        return count, [city for city, freq in self.city_counter.most_common() if freq == count]
+
+    def resumo(self):
+        """
+        Returns:
+            dict: Estatísticas gerais da varredura
+        """
+        count, cities = self.cidades_mais_frequentes()
+        return {
+            'rows': self.rows,
+            'min_distance': self.min_distance,
+            'min_path': self.min_path,
+            'max_distance': self.max_distance,
+            'max_path': self.max_path,
+            'mean_distance': self.overall.mean,
+            'std_distance': self.overall.desvio_padrao(),
+            'median_distance': self.quantiles.quantil(0.5),
+            'p90_distance': self.quantiles.quantil(0.9),
+            'distinct_tours': self.distinct_tours.valor(),
+            'most_common_city_count': count,
+            'most_common_cities': cities,
+        }
+
+def analisar_csv(file_path, aggregator=None):
+    """
+    Lê um CSV de resultados uma única vez, linha a linha, agregando-o.
+
+    Args:
+        file_path (str): Caminho do CSV
+        aggregator (AgregadorResultados): Agregador a atualizar (permite somar
+            vários arquivos); se None, cria um novo
+
+    Returns:
+        AgregadorResultados: Agregador com os resultados do arquivo
+    """
+    aggregator = aggregator or AgregadorResultados()
+    with open(file_path, mode='r', encoding='utf-8', newline='') as csv_file:
+        reader = csv.reader(csv_file)
+        header = next(reader, None)
+        if header is None:
+            return aggregator
+        distance_col = header.index('Best Distance')
+        path_col = header.index('Best Path')
+        # Arquivos antigos não têm a coluna de seleção
+        config_cols = [header.index(name) for name in COLUNAS_CONFIGURACAO if name in header]
         for row in reader:
-            # Obtém a distância e o caminho
-            distance = float(row['Best Distance'])
-            path = row['Best Path'].split(" -> ")
-            
-            # Atualiza o contador de cidades
-            city_counter.update(path)
-            
-            # Adiciona informações para o gráfico de linhas
-            run_distances.append(distance)
-            run_labels.append(row['Run'])
-            
-            # Verifica menor distância
-            if distance < min_distance:
-                min_distance = distance
-                min_distance_path = path
-            
-            # Verifica maior distância
-            if distance > max_distance:
-                max_distance = distance
-                max_distance_path = path
-    
-    # Cidade mais frequente
-    most_common_city = city_counter.most_common(1)
-    
-    # Gera gráficos
-    plt.figure(figsize=(12, 6))
-
-    # Gráfico de barras: Contagem de cidades
-    plt.subplot(1, 2, 1)
-    cities, counts = zip(*city_counter.most_common())
-    plt.bar(cities, counts, color='skyblue')
-    plt.title('Ocorrência de Cidades nas Rotas')
-    plt.xlabel('Cidades')
-    plt.ylabel('Ocorrências')
-    plt.xticks(rotation=45, ha='right')
-    
-    # Gráfico de linha: Distâncias por execução
-    plt.subplot(1, 2, 2)
-    plt.plot(run_labels, run_distances, marker='o', color='green', linestyle='--')
-    plt.title('Distâncias por Execução')
-    plt.xlabel('Execução (Run)')
-    plt.ylabel('Distância')
-    plt.xticks(rotation=45)
-    
-    # Ajusta layout e exibe
-    plt.tight_layout()
-    plt.show()
-    
-    return {
-        "min_distance_path": min_distance_path,
-        "max_distance_path": max_distance_path,
-        "most_common_city": most_common_city[0] if most_common_city else None
-    }
+            aggregator.adicionar(float(row[distance_col]), row[path_col].split(" -> "),
+                                 tuple(row[i] for i in config_cols))
+    return aggregator
+
+def gerar_graficos(aggregator, plots=('summary', 'cities', 'configs'), output_dir=None):
+    """
+    Gera os gráficos a partir de um agregador já preenchido.
+
+    Args:
+        aggregator (AgregadorResultados): Resultados agregados
+        plots (tuple): Gráficos desejados: 'summary' (menor, mediana, p90 e
+            maior distância), 'cities' (ocorrência de cidades) e 'configs'
+            (média e desvio padrão por configuração)
+        output_dir (str): Diretório onde salvar os gráficos; se None, exibe na tela
+    """
+    summary = aggregator.resumo()
+    figures = {}
+    if 'summary' in plots:
+        figures['summary'] = plt.figure(figsize=(8, 6))
+        labels = ['Menor Distância', 'Mediana', 'P90', 'Maior Distância']
+        values = [summary['min_distance'], summary['median_distance'],
+                  summary['p90_distance'], summary['max_distance']]
+        plt.bar(labels, values, color=['green', 'blue', 'orange', 'red'])
+        plt.title('Análise de Distâncias')
+        plt.ylabel('Distância')
+        plt.xlabel('Categorias')
+        plt.tight_layout()
+
+    if 'cities' in plots and aggregator.city_counter:
+        figures['cities'] = plt.figure(figsize=(8, 6))
+        cities, counts = zip(*aggregator.city_counter.most_common())
+        plt.bar(cities, counts, color='skyblue')
+        plt.title('Ocorrência de Cidades nas Rotas')
+        plt.xlabel('Cidades')
+        plt.ylabel('Ocorrências')
+        plt.xticks(rotation=45, ha='right')
+        plt.tight_layout()
+
+    if 'configs' in plots and aggregator.groups:
+        figures['configs'] = plt.figure(figsize=(12, 6))
+        configs = sorted(aggregator.groups, key=lambda config: aggregator.groups[config].mean)
+        means = [aggregator.groups[config].mean for config in configs]
+        stds = [aggregator.groups[config].desvio_padrao() for config in configs]
+        plt.bar(range(len(configs)), means, yerr=stds, color='green', alpha=0.7)
+        plt.xticks(range(len(configs)), ['/'.join(config) for config in configs],
+                   rotation=90, fontsize=7)
+        plt.title('Distância Média por Configuração')
+        plt.xlabel('Configuração (' + '/'.join(COLUNAS_CONFIGURACAO) + ')')
+        plt.ylabel('Distância')
+        plt.tight_layout()
+
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+        for name, figure in figures.items():
+            figure.savefig(os.path.join(output_dir, f'{name}.png'))
+            plt.close(figure)
+    elif figures:
+        plt.show()
+
 def process_csv(file_path):
-    # Inicializa variáveis para armazenar resultados
-    min_distance = float('inf')
-    max_distance = float('-inf')
-    min_distance_path = []
-    max_distance_path = []
-    city_counter = Counter()
-    
-    # Lê o arquivo CSV
-    with open(file_path, mode='r', encoding='utf-8') as csv_file:
-        reader = csv.DictReader(csv_file)
-        
-        for row in reader:
-            # Obtém a distância e o caminho
-            distance = float(row['Best Distance'])
-            path = row['Best Path'].split(" -> ")
-            
-            # Atualiza o contador de cidades
-            city_counter.update(path)
-            
-            # Verifica menor distância
-            if distance < min_distance:
-                min_distance = distance
-                min_distance_path = path
-            
-            # Verifica maior distância
-            if distance > max_distance:
-                max_distance = distance
-                max_distance_path = path
-    
-    # Cidade mais frequente
-    most_common_city = city_counter.most_common(1)
-    
+    """
+    Menor e maior distância com seus caminhos e a cidade mais frequente.
+    """
+    aggregator = analisar_csv(file_path)
+    most_common_city = aggregator.city_counter.most_common(1)
     return {
-        "min_distance_path": min_distance_path,
-        "max_distance_path": max_distance_path,
+        "min_distance_path": aggregator.min_path,
+        "max_distance_path": aggregator.max_path,
         "most_common_city": most_common_city[0] if most_common_city else None
     }
-def process_and_filter_csv(file_path):
-    # Inicializa variáveis para armazenar resultados
-    unique_paths = {}
-    city_counter = Counter()
-    
-    # Lê o arquivo CSV
-    with open(file_path, mode='r', encoding='utf-8') as csv_file:
-        reader = csv.DictReader(csv_file)
-        
-        for row in reader:
-            # Obtém a distância e o caminho
-            distance = float(row['Best Distance'])
-            path = tuple(row['Best Path'].split(" -> "))  # Usar tuple para garantir unicidade
-            
-            # Adiciona ao dicionário de caminhos únicos
-            if path not in unique_paths:
-                unique_paths[path] = distance
-            
-            # Atualiza o contador de cidades
-            city_counter.update(path)
-    
-    # Ordena os caminhos únicos por distância
-    sorted_paths = sorted(unique_paths.items(), key=lambda x: x[1])
-    
-    # Obtém menor e maior distância
-    min_distance, min_path = sorted_paths[0]
-    max_distance, max_path = sorted_paths[-1]
-    
-    # Obtém as cidades mais frequentes
-    most_common_city_count = city_counter.most_common(1)
-    if most_common_city_count:
-        most_common_city, count = most_common_city_count[0]
-        cities_with_count = [city for city, _ in city_counter.most_common() if city_counter[city] == count]
-    else:
-        most_common_city = count = 0
-        cities_with_count = []
-    
-    # Retorno no formato desejado
-    result = [
-        {"menor Distancia": min_distance, "lista": list(min_path)},
-        {"maior Distancia": max_distance, "lista": list(max_path)},
-        {"lista de cidades que mais repete": count, "lista": cities_with_count}
-    ]
-    
-    return result
 
 def process_and_filter_csv_fixed(file_path):
-    # Inicializa variáveis para armazenar resultados
-    unique_paths = {}
-    city_counter = Counter()
-    
-    # Lê o arquivo CSV
-    with open(file_path, mode='r', encoding='utf-8') as csv_file:
-        reader = csv.DictReader(csv_file)
-        
-        for row in reader:
-            # Obtém a distância e o caminho
-            distance = float(row['Best Distance'])
-            path = tuple(row['Best Path'].split(" -> "))  # Usar tuple para garantir unicidade
-            
-            # Adiciona ao dicionário de caminhos únicos
-            if path not in unique_paths:
-                unique_paths[path] = distance
-            
-            # Atualiza o contador de cidades
-            city_counter.update(path)
-    
-    # Ordena os caminhos únicos por distância
-    sorted_paths = sorted(unique_paths.items(), key=lambda x: x[1])  # Lista de (path, distance)
-    
-    # Obtém menor e maior distância
-    min_path, min_distance = sorted_paths[0]
-    max_path, max_distance = sorted_paths[-1]
-    
-    # Obtém as cidades mais frequentes
-    most_common_city_count = city_counter.most_common(1)
-    if most_common_city_count:
-        most_common_city, count = most_common_city_count[0]
-        cities_with_count = [city for city, freq in city_counter.most_common() if freq == count]
-    else:
-        most_common_city = count = 0
-        cities_with_count = []
-    
-    # Retorno no formato desejado
-    result = [
-        {"menor Distancia": min_distance, "lista": list(min_path)},
-        {"maior Distancia": max_distance, "lista": list(max_path)},
-        {"lista de cidades que mais repete": count, "lista": cities_with_count}
+    """
+    Resultado no formato usado em resultados.txt.
+    """
+    aggregator = analisar_csv(file_path)
+    count, cities = aggregator.cidades_mais_frequentes()
+    return [
+        {"menor Distancia": aggregator.min_distance, "lista": aggregator.min_path},
+        {"maior Distancia": aggregator.max_distance, "lista": aggregator.max_path},
+        {"lista de cidades que mais repete": count, "lista": cities}
     ]
-    
-    return result
-
 
-# Caminho para salvar e testar o arquivo CSV
-csv_file_path = 'ga_results_tournment.csv'
+def main():
+    parser = argparse.ArgumentParser(description="Analisa CSVs de resultados da varredura")
+    parser.add_argument('files', nargs='*', default=['ga_results_tournment.csv'])
+    parser.add_argument('--plots', nargs='*', default=[],
+                        choices=['summary', 'cities', 'configs'])
+    parser.add_argument('--output-dir', default=None)
+    args = parser.parse_args()
 
+    aggregator = AgregadorResultados()
+    for file_path in args.files:
+        analisar_csv(file_path, aggregator)
+    for key, value in aggregator.resumo().items():
+        print(f"{key}: {value}")
+    if args.plots:
+        gerar_graficos(aggregator, args.plots, args.output_dir)
 
-# Processa o arquivo e retorna o resultado filtrado com a lógica corrigida
-filtered_results_fixed = process_and_filter_csv_fixed(csv_file_path)
-print(filtered_results_fixed)
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+from functools import lru_cache
+import numpy as np
+
+# Semente fixa dos pesos do hash, para que o hash seja o mesmo entre execuções
+SEMENTE_HASH = 0x70E5
+# Elementos processados por bloco no hash; temporários pequenos ficam no cache
+# e são reaproveitados pelo alocador em vez de mapeados a cada chamada
+ELEMENTOS_POR_BLOCO = 1 << 14
+
+@lru_cache(maxsize=8)
+def _pesos(n):
+    """Pesos aleatórios ímpares de 64 bits, um valor por cidade."""
+    weights = np.random.default_rng(SEMENTE_HASH).integers(1, 2**63, size=n, dtype=np.uint64)
+    weights |= np.uint64(1)
+    # O mesmo array é devolvido a todas as chamadas
+    weights.flags.writeable = False
+    return weights
+
+def forma_canonica(tours):
+    """
+    Coloca caminhos de índices na forma canônica do ciclo.
+
+    O mesmo ciclo pode ser escrito com n rotações e dois sentidos. A forma
+    canônica começa na cidade 0 e segue no sentido em que a segunda cidade
+    é a menor das duas vizinhas de 0. Vetorizado sobre as linhas.
+
+    Args:
+        tours (numpy.ndarray): Caminhos (permutações de 0..n-1), formato (m, n) ou (n,)
+
+    Returns:
+        numpy.ndarray: Caminhos na forma canônica, mesmo formato
+    """
+    tours = np.asarray(tours)
+    single = tours.ndim == 1
+    tours = np.atleast_2d(tours)
+    m, n = tours.shape
+    if n < 3:
+        return np.sort(tours, axis=1)[0] if single else np.sort(tours, axis=1)
+
+    start = np.argmin(tours, axis=1)
+    # Rotação por fatiamento do caminho duplicado, evitando o módulo elemento a elemento
+    doubled = np.concatenate((tours, tours), axis=1)
+    rotated = np.take_along_axis(doubled, start[:, np.newaxis] + np.arange(n), axis=1)
+    reflect = rotated[:, 1] > rotated[:, -1]
+    rotated[reflect, 1:] = rotated[reflect, :0:-1]
+    return rotated[0] if single else rotated
+
+def hash_caminhos(tours):
+    """
+    Calcula um hash de 64 bits do ciclo representado por cada caminho.
+
+    Um ciclo é determinado pelo seu conjunto de arestas não orientadas, então
+    o hash soma (módulo 2^64) um valor por aresta {a, b}, w[a] * w[b], com
+    pesos aleatórios fixos. O produto não depende da ordem das pontas, então
+    o resultado é o mesmo para todas as rotações e para os dois sentidos, sem
+    precisar calcular a forma canônica; ciclos diferentes colidem com
+    probabilidade desprezível.
+
+    Args:
+        tours (numpy.ndarray): Caminhos de índices, formato (m, n)
+
+    Returns:
+        numpy.ndarray: Hashes (uint64), um por caminho
+    """
+    tours = np.atleast_2d(tours)
+    weights = _pesos(tours.shape[1])
+    hashes = np.empty(len(tours), dtype=np.uint64)
+    rows = max(1, ELEMENTOS_POR_BLOCO // max(tours.shape[1], 1))
+    for start in range(0, len(tours), rows):
+        w = np.take(weights, tours[start:start + rows])
+        # Arestas internas do caminho mais a aresta que fecha o ciclo
+        hashes[start:start + rows] = (w[:, :-1] * w[:, 1:]).sum(axis=1, dtype=np.uint64) + w[:, 0] * w[:, -1]
+    return hashes
+
+def forma_canonica_nomes(path):
+    """
+    Forma canônica de um caminho com cidades de qualquer tipo ordenável
+    (por exemplo, nomes lidos dos CSVs de resultados).
+
+    Args:
+        path (list): Cidades do caminho, na ordem de visita
+
+    Returns:
+        tuple: Caminho iniciado na menor cidade, no sentido da menor vizinha
+    """
+    path = list(path)
+    if len(path) < 3:
+        return tuple(sorted(path))
+    start = path.index(min(path))
+    rotated = path[start:] + path[:start]
+    if rotated[1] > rotated[-1]:
+        rotated = rotated[:1] + rotated[:0:-1]
+    return tuple(rotated)
@@ -0,0 +1,249 @@
+import numpy as np
+
+def _mascara_cidades(parents, keep_positions):
+    """
+    Marca quais cidades ocupam as posições preservadas de cada pai.
+
+    Args:
+        parents (numpy.ndarray): Pais, formato (m, n)
+        keep_positions (numpy.ndarray): Máscara (m, n) das posições preservadas
+
+    Returns:
+        numpy.ndarray: Máscara (m, n) indexada pela cidade
+    """
+    m, _ = parents.shape
+    in_segment = np.zeros(parents.shape, dtype=bool)
+    in_segment[np.arange(m)[:, np.newaxis], parents] = keep_positions
+    return in_segment
+
+def _completar_em_ordem(children, donors, in_segment, read_start, write_start):
+    """
+    Preenche as posições livres dos filhos com as cidades do doador que ainda
+    não estão no filho, na ordem em que aparecem no doador.
+
+    A leitura do doador começa em read_start e a escrita no filho em
+    write_start, ambas circulares. Tudo é feito em O(m * n) sem laços em Python.
+
+    Args:
+        children (numpy.ndarray): Filhos parcialmente preenchidos (alterados in place)
+        donors (numpy.ndarray): Pais que doam as cidades restantes
+        in_segment (numpy.ndarray): Máscara (m, n), por cidade, do que já está no filho
+        read_start (numpy.ndarray): Posição inicial de leitura em cada doador
+        write_start (numpy.ndarray): Posição inicial de escrita em cada filho
+    """
+    m, n = donors.shape
+    rows = np.arange(m)[:, np.newaxis]
+    positions = np.arange(n)
+    ordered = donors[rows, (read_start[:, np.newaxis] + positions) % n]
+    fill = ~in_segment[rows, ordered]
+    target = (write_start[:, np.newaxis] + np.cumsum(fill, axis=1) - 1) % n
+    children[np.broadcast_to(rows, (m, n))[fill], target[fill]] = ordered[fill]
+
+def crossover_um_ponto(parents1, parents2, rng):
+    """
+    Crossover de um ponto que preserva a ordem: o filho recebe o prefixo de um
+    pai e completa com as demais cidades na ordem do outro pai.
+
+    Args:
+        parents1 (numpy.ndarray): Primeiros pais, formato (m, n)
+        parents2 (numpy.ndarray): Segundos pais, formato (m, n)
+        rng (numpy.random.Generator): Gerador de números aleatórios
+
+    Returns:
+        tuple: Dois arrays (m, n) de filhos
+    """
+    m, n = parents1.shape
+    cut_points = rng.integers(1, n, size=m) if n > 1 else np.ones(m, dtype=int)
+    keep = np.arange(n) < cut_points[:, np.newaxis]
+    start = np.zeros(m, dtype=int)
+
+    children = []
+    for first, second in ((parents1, parents2), (parents2, parents1)):
+        child = np.empty_like(first)
+        child[keep] = first[keep]
+        _completar_em_ordem(child, second, _mascara_cidades(first, keep), start, cut_points)
+        children.append(child)
+    return tuple(children)
+
+def crossover_ox(parents1, parents2, rng):
+    """
+    Order crossover (OX): o filho mantém um trecho contínuo de um pai e
+    completa as posições a partir do fim do trecho com as cidades do outro pai,
+    na ordem em que aparecem a partir do mesmo ponto.
+
+    Args:
+        parents1 (numpy.ndarray): Primeiros pais, formato (m, n)
+        parents2 (numpy.ndarray): Segundos pais, formato (m, n)
+        rng (numpy.random.Generator): Gerador de números aleatórios
+
+    Returns:
+        tuple: Dois arrays (m, n) de filhos
+    """
+    m, n = parents1.shape
+    start = rng.integers(0, n, size=m)
+    end = rng.integers(start + 1, n + 1)
+    positions = np.arange(n)
+    keep = (positions >= start[:, np.newaxis]) & (positions < end[:, np.newaxis])
+    end = end % n
+
+    children = []
+    for first, second in ((parents1, parents2), (parents2, parents1)):
+        child = np.empty_like(first)
+        child[keep] = first[keep]
+        _completar_em_ordem(child, second, _mascara_cidades(first, keep), end, end)
+        children.append(child)
+    return tuple(children)
+
+def _pmx(first, second, keep):
+    """
+    Gera os filhos do PMX para um par de papéis (first fornece o trecho).
+
+    Args:
+        first (numpy.ndarray): Pais que fornecem o trecho, formato (m, n)
+        second (numpy.ndarray): Pais que fornecem o restante
+        keep (numpy.ndarray): Máscara (m, n) das posições do trecho
+
+    Returns:
+        numpy.ndarray: Filhos, formato (m, n)
+    """
+    m, n = first.shape
+    rows = np.arange(m)[:, np.newaxis]
+    cities = np.arange(n)
+    in_segment = _mascara_cidades(first, keep)
+
+    position_in_first = np.empty_like(first)
+    position_in_first[rows, first] = cities
+    # Mapeamento do PMX: cidade do trecho de first -> cidade de second na mesma posição
+    mapping = np.where(in_segment, second[rows, position_in_first], cities)
+
+    # Segue as cadeias do mapeamento por duplicação de ponteiros: a cada passo o
+    # salto dobra, então bastam O(log n) passos vetorizados
+    values = second.copy()
+    outside = ~keep
+    while True:
+        following = mapping[rows, values]
+        if not (following != values)[outside].any():
+            break
+        values = following
+        mapping = mapping[rows, mapping]
+
+    return np.where(keep, first, values)
+
+def crossover_pmx(parents1, parents2, rng):
+    """
+    Partially mapped crossover (PMX): o filho recebe um trecho de um pai e as
+    demais posições do outro pai, resolvendo conflitos pelo mapeamento do trecho.
+
+    Args:
+        parents1 (numpy.ndarray): Primeiros pais, formato (m, n)
+        parents2 (numpy.ndarray): Segundos pais, formato (m, n)
+        rng (numpy.random.Generator): Gerador de números aleatórios
+
+    Returns:
+        tuple: Dois arrays (m, n) de filhos
+    """
+    m, n = parents1.shape
+    start = rng.integers(0, n, size=m)
+    end = rng.integers(start + 1, n + 1)
+    positions = np.arange(n)
+    keep = (positions >= start[:, np.newaxis]) & (positions < end[:, np.newaxis])
+    return _pmx(parents1, parents2, keep), _pmx(parents2, parents1, keep)
+
+def _tabela_arestas(parents1, parents2):
+    """
+    Monta a tabela de arestas (vizinhos de cada cidade nos dois pais).
+
+    Args:
+        parents1 (numpy.ndarray): Primeiros pais, formato (m, n)
+        parents2 (numpy.ndarray): Segundos pais, formato (m, n)
+
+    Returns:
+        numpy.ndarray: Vizinhos de cada cidade, formato (m, n, 4); -1 marca vizinho repetido
+    """
+    m, n = parents1.shape
+    rows = np.arange(m)[:, np.newaxis]
+    table = np.empty((m, n, 4), dtype=parents1.dtype)
+    for k, parent in enumerate((parents1, parents2)):
+        table[rows, parent, 2 * k] = np.roll(parent, 1, axis=1)
+        table[rows, parent, 2 * k + 1] = np.roll(parent, -1, axis=1)
+
+    # Arestas comuns aos dois pais aparecem uma única vez
+    for slot in range(1, 4):
+        repeated = (table[:, :, :slot] == table[:, :, slot:slot + 1]).any(axis=2)
+        table[:, :, slot][repeated] = -1
+    return table
+
+def _erx(parents1, parents2, rng):
+    """
+    Gera um filho por par com edge recombination (ERX).
+
+    Args:
+        parents1 (numpy.ndarray): Pais que definem a cidade inicial, formato (m, n)
+        parents2 (numpy.ndarray): Segundos pais, formato (m, n)
+        rng (numpy.random.Generator): Gerador de números aleatórios
+
+    Returns:
+        numpy.ndarray: Filhos, formato (m, n)
+    """
+    m, n = parents1.shape
+    rows = np.arange(m)
+    table = _tabela_arestas(parents1, parents2)
+    used = np.zeros((m, n), dtype=bool)
+    child = np.empty_like(parents1)
+
+    # Ordem aleatória usada quando a cidade atual não tem vizinhos livres
+    fallback = np.argsort(rng.random((m, n)), axis=1)
+    pointer = np.zeros(m, dtype=int)
+
+    current = parents1[:, 0]
+    child[:, 0] = current
+    used[rows, current] = True
+    for step in range(1, n):
+        candidates = table[rows, current]
+        safe = np.maximum(candidates, 0)
+        valid = (candidates >= 0) & ~used[rows[:, np.newaxis], safe]
+
+        # Grau de cada candidato: quantos vizinhos ainda livres ele possui
+        neighbours = table[rows[:, np.newaxis], safe]
+        free = (neighbours >= 0) & ~used[rows[:, np.newaxis, np.newaxis], np.maximum(neighbours, 0)]
+        score = np.where(valid, free.sum(axis=2) + rng.random((m, 4)) * 0.5, np.inf)
+        chosen = candidates[rows, np.argmin(score, axis=1)]
+
+        stuck = ~valid.any(axis=1)
+        if stuck.any():
+            while True:
+                advance = stuck & used[rows, fallback[rows, pointer]]
+                if not advance.any():
+                    break
+                pointer[advance] += 1
+            chosen = np.where(stuck, fallback[rows, pointer], chosen)
+
+        child[:, step] = chosen
+        used[rows, chosen] = True
+        current = chosen
+    return child
+
+def crossover_erx(parents1, parents2, rng):
+    """
+    Edge recombination crossover (ERX): constrói o filho preferindo arestas
+    presentes nos pais, escolhendo sempre o vizinho com menos arestas livres.
+
+    O laço percorre as n posições, mas cada passo é vetorizado sobre todos
+    os pares, com custo constante por par.
+
+    Args:
+        parents1 (numpy.ndarray): Primeiros pais, formato (m, n)
+        parents2 (numpy.ndarray): Segundos pais, formato (m, n)
+        rng (numpy.random.Generator): Gerador de números aleatórios
+
+    Returns:
+        tuple: Dois arrays (m, n) de filhos
+    """
+    return _erx(parents1, parents2, rng), _erx(parents2, parents1, rng)
+
+OPERADORES_CROSSOVER = {
+    'one_point': crossover_um_ponto,
+    'ox': crossover_ox,
+    'pmx': crossover_pmx,
+    'erx': crossover_erx,
+}
@@ -1,3 +1,6 @@
+import math
+from abc import ABC, abstractmethod
+from collections import OrderedDict
 import numpy as np
 
 def distancia_cidades(coord1, coord2):
@@ -34,4 +37,261 @@ def distancia_total(path, coordinates):
         coordinates[path[0]]
     )
     
-    return total_distance
\ No newline at end of file
+    return total_distance
+
+def distancias_populacao(population, dist_matrix):
+    """
+    Calcula a distância total de todos os caminhos de uma população de uma só vez.
+    
+    Args:
+        population (numpy.ndarray): População de caminhos, formato (pop_size, n_cities)
+        dist_matrix (numpy.ndarray): Matriz de distâncias entre as cidades
+    
+    Returns:
+        numpy.ndarray: Distância total de cada caminho, incluindo o retorno à cidade inicial
+    """
+    population = np.asarray(population)
+    return dist_matrix[population, np.roll(population, -1, axis=1)].sum(axis=1)
+
+def euclidiana(coords_a, coords_b):
+    """
+    Distância euclidiana vetorizada entre pares de coordenadas.
+    
+    Args:
+        coords_a (numpy.ndarray): Coordenadas de origem, formato (..., 2)
+        coords_b (numpy.ndarray): Coordenadas de destino, mesmo formato
+    
+    Returns:
+        numpy.ndarray: Distâncias, formato (...)
+    """
+    diff = coords_a - coords_b
+    return np.sqrt(np.sum(diff * diff, axis=-1))
+
+class OraculoDistancia(ABC):
+    """
+    Interface comum dos backends de distância entre cidades (por índice).
+    
+    Todos os backends aceitam indexação como uma matriz, oraculo[a, b], com
+    índices escalares ou arrays de índices. Cada backend implementa pares().
+    """
+    # Máximo de pares calculados de uma vez ao avaliar populações inteiras
+    chunk_pairs = 1 << 20
+
+    def __init__(self, coordinates, metric=euclidiana):
+        """
+        Args:
+            coordinates (array-like): Coordenadas das cidades, formato (n, 2)
+            metric (callable): Métrica vetorizada metric(coords_a, coords_b)
+        """
+        self.coordinates = np.ascontiguousarray(coordinates, dtype=float)
+        self.metric = metric
+        self.n = len(self.coordinates)
+
+    @abstractmethod
+    def pares(self, a, b):
+        """
+        Calcula as distâncias entre as cidades a[i] e b[i].
+        
+        Args:
+            a (numpy.ndarray): Índices das cidades de origem
+            b (numpy.ndarray): Índices das cidades de destino
+        
+        Returns:
+            numpy.ndarray: Distâncias, no formato de a e b
+        """
+
+    def distancia(self, a, b):
+        """
+        Retorna a distância entre duas cidades.
+        
+        Args:
+            a (int): Índice da primeira cidade
+            b (int): Índice da segunda cidade
+        
+        Returns:
+            float: Distância entre as cidades
+        """
+        return float(self.pares(np.asarray(a), np.asarray(b)))
+
+    def __getitem__(self, key):
+        a, b = key
+        # Consultas escalares (busca local, avaliação incremental) evitam o caminho vetorizado
+        if isinstance(a, (int, np.integer)) and isinstance(b, (int, np.integer)):
+            return self.distancia(int(a), int(b))
+        return self.pares(np.asarray(a), np.asarray(b))
+
+    def caminhos(self, population):
+        """
+        Calcula a distância total de cada caminho, em blocos de linhas para
+        limitar a memória temporária.
+        
+        Args:
+            population (numpy.ndarray): Caminhos, formato (m, n)
+        
+        Returns:
+            numpy.ndarray: Distância total de cada caminho
+        """
+        population = np.asarray(population)
+        rows = max(1, self.chunk_pairs // max(population.shape[1], 1))
+        totals = np.empty(len(population))
+        for start in range(0, len(population), rows):
+            block = population[start:start + rows]
+            totals[start:start + rows] = self.pares(block, np.roll(block, -1, axis=1)).sum(axis=1)
+        return totals
+
+    def bytes_memoria(self):
+        """
+        Returns:
+            int: Memória ocupada pelo backend, em bytes
+        """
+        return self.coordinates.nbytes
+
+class MatrizDistancias(OraculoDistancia):
+    """
+    Backend com a matriz n x n completa, pré-calculada. Indicado para n pequeno.
+    """
+    def __init__(self, coordinates, metric=euclidiana, matrix=None):
+        """
+        Args:
+            coordinates (array-like): Coordenadas das cidades, formato (n, 2)
+            metric (callable): Métrica vetorizada metric(coords_a, coords_b)
+            matrix (numpy.ndarray): Matriz já calculada (opcional)
+        """
+        super().__init__(coordinates, metric)
+        if matrix is None:
+            matrix = np.empty((self.n, self.n))
+            rows = max(1, self.chunk_pairs // max(self.n, 1))
+            for start in range(0, self.n, rows):
+                block = self.coordinates[start:start + rows]
+                matrix[start:start + rows] = metric(block[:, np.newaxis, :], self.coordinates[np.newaxis, :, :])
+        self.matrix = matrix
+
+    def pares(self, a, b):
+        return self.matrix[a, b]
+
+    def caminhos(self, population):
+        return distancias_populacao(population, self.matrix)
+
+    def bytes_memoria(self):
+        return super().bytes_memoria() + self.matrix.nbytes
+
+class DistanciaSobDemanda(OraculoDistancia):
+    """
+    Backend que calcula as distâncias na hora, de forma vetorizada, a partir
+    de um array contíguo de coordenadas. Usa memória O(n).
+    """
+    def __init__(self, coordinates, metric=euclidiana):
+        super().__init__(coordinates, metric)
+        # Cópia em listas para consultas escalares rápidas com math.dist
+        self.points = self.coordinates.tolist() if metric is euclidiana else None
+
+    def distancia(self, a, b):
+        if self.points is not None:
+            return math.dist(self.points[a], self.points[b])
+        return float(self.metric(self.coordinates[a], self.coordinates[b]))
+
+    def pares(self, a, b):
+        return self.metric(self.coordinates[a], self.coordinates[b])
+
+class DistanciaCacheLRU(OraculoDistancia):
+    """
+    Backend para métricas caras ou não vetorizadas: cada par é calculado
+    com metric(coord_a, coord_b) escalar e guardado em um cache LRU limitado.
+    O algoritmo genético exige uma métrica simétrica, d(a, b) = d(b, a): a
+    avaliação incremental das mutações, o 2-opt, o Or-opt e o hash dos
+    caminhos sem orientação dependem disso. Por isso (a, b) e (b, a)
+    ocupam uma única entrada do cache.
+    """
+    def __init__(self, coordinates, metric, max_entries=1_000_000):
+        """
+        Args:
+            coordinates (array-like): Coordenadas das cidades, formato (n, 2)
+            metric (callable): Métrica escalar metric(coord_a, coord_b)
+            max_entries (int): Número máximo de pares guardados no cache
+        """
+        super().__init__(coordinates, metric)
+        self.max_entries = max_entries
+        self.cache = OrderedDict()
+
+    def distancia(self, a, b):
+        """
+        Retorna a distância entre duas cidades, usando o cache.
+        
+        Args:
+            a (int): Índice da primeira cidade
+            b (int): Índice da segunda cidade
+        
+        Returns:
+            float: Distância entre as cidades
+        """
+        key = (a, b) if a <= b else (b, a)
+        value = self.cache.get(key)
+        if value is None:
+            value = float(self.metric(self.coordinates[a], self.coordinates[b]))
+            self.cache[key] = value
+            if len(self.cache) > self.max_entries:
+                self.cache.popitem(last=False)
+        else:
+            self.cache.move_to_end(key)
+        return value
+
+    def pares(self, a, b):
+        a, b = np.broadcast_arrays(a, b)
+        result = np.fromiter(
+            (self.distancia(i, j) for i, j in zip(a.ravel().tolist(), b.ravel().tolist())),
+            dtype=float, count=a.size
+        )
+        return result.reshape(a.shape)
+
+    def bytes_memoria(self):
+        # Estimativa: cada entrada do OrderedDict ocupa cerca de 200 bytes
+        return super().bytes_memoria() + 200 * len(self.cache)
+
+def criar_oraculo(coordinates, metric=None, backend='auto',
+                  memory_budget=512 * 2**20, cache_size=1_000_000, matrix=None,
+                  vectorized_metric=True):
+    """
+    Cria o backend de distâncias adequado ao tamanho da instância.
+    
+    No modo 'auto' usa a matriz completa quando ela cabe em memory_budget;
+    acima disso calcula as distâncias sob demanda se a métrica for vetorizada
+    (a euclidiana padrão ou uma métrica vetorizada informada) ou usa o cache
+    LRU para métricas escalares, caras ou não vetorizáveis.
+    
+    Args:
+        coordinates (array-like): Coordenadas das cidades, formato (n, 2)
+        metric (callable): Métrica metric(coords_a, coords_b); None usa a distância euclidiana
+        backend (str): 'auto', 'matrix', 'on_demand' ou 'lru'
+        memory_budget (int): Memória máxima, em bytes, para a matriz completa
+        cache_size (int): Número máximo de pares no cache LRU
+        matrix (numpy.ndarray): Matriz de distâncias já calculada (opcional)
+        vectorized_metric (bool): Se False, metric aceita apenas um par de
+            coordenadas por chamada
+    
+    Returns:
+        OraculoDistancia: Backend de distâncias
+    """
+    coordinates = np.asarray(coordinates, dtype=float)
+    if matrix is not None:
+        return MatrizDistancias(coordinates, metric or euclidiana, matrix=matrix)
+
+    n = len(coordinates)
+    scalar_metric = metric is not None and not vectorized_metric
+    metric = metric or euclidiana
+    if backend == 'auto':
+        if n * n * 8 <= memory_budget:
+            backend = 'matrix'
+        else:
+            backend = 'lru' if scalar_metric else 'on_demand'
+
+    if backend == 'matrix':
+        if scalar_metric:
+            metric = np.vectorize(metric, signature='(k),(k)->()')
+        return MatrizDistancias(coordinates, metric)
+    if backend == 'on_demand':
+        if scalar_metric:
+            raise ValueError("O backend 'on_demand' exige uma métrica vetorizada")
+        return DistanciaSobDemanda(coordinates, metric)
+    if backend == 'lru':
+        return DistanciaCacheLRU(coordinates, metric, max_entries=cache_size)
+    raise ValueError(f"Backend de distâncias desconhecido: {backend}")
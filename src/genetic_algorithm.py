@@ -1,7 +1,20 @@
-import random
+import json
+import math
+import time
+from collections import Counter
+from functools import partial
 import numpy as np
-from itertools import permutations
-from .distance_calculator import distancia_total
+from .distance_calculator import criar_oraculo, MatrizDistancias
+from .crossover import OPERADORES_CROSSOVER
+from .selection import OPERADORES_SELECAO
+from .local_search import listas_vizinhos, dois_opt, or_opt
+from .spatial_index import GradeEspacial, tour_vizinho_mais_proximo, tour_arestas_gulosas
+from .random_streams import criar_gerador, fluxos_independentes
+from .canonical_tour import hash_caminhos
+from .indexed_heap import HeapIndexado
+
+# Fases de uma geração cronometradas por evoluir_geracao
+FASES = ('selection', 'crossover', 'fitness', 'mutation', 'local_search', 'survivors')
 
 class AlgoritmoGenetico:
     """
@@ -12,155 +25,967 @@ class AlgoritmoGenetico:
                  crossover_rate=0.8, 
                  mutation_rate=0.2, 
                  generations=200,
-                 tournament_size=3):
+                 tournament_size=3,
+                 unique_population=False,
+                 crossover_method='one_point',
+                 selection_method='roulette',
+                 replacement='plus',
+                 elitism=0,
+                 dist_matrix=None,
+                 metric=None,
+                 distance_backend='auto',
+                 memory_budget=512 * 2**20,
+                 vectorized_metric=True,
+                 seed=None,
+                 local_search=None,
+                 local_search_budget=10000,
+                 neighbor_k=10,
+                 construction_fraction=0.0,
+                 time_limit=None,
+                 max_evaluations=None,
+                 target_distance=None,
+                 stagnation_generations=None,
+                 deduplicate=True,
+                 steady_state_batch=2,
+                 steady_state_victim='worst'):
         """
         Inicializa o Algoritmo Genético.
         
         Args:
             city_names (list): Nomes das cidades
-            city_coordinates (dict): Coordenadas das cidades
+            city_coordinates (dict): Coordenadas das cidades (ou array (n, 2) na ordem
+                de city_names, usado sem cópia, por exemplo mapeado em memória)
             population_size (int): Tamanho da população
             crossover_rate (float): Taxa de crossover
             mutation_rate (float): Taxa de mutação
             generations (int): Número de gerações
             tournament_size (int): Número de indivíduos no torneio
+            unique_population (bool): Se True, a população inicial não contém caminhos repetidos
+            crossover_method (str): Operador de crossover ('one_point', 'ox', 'pmx' ou 'erx')
+            selection_method (str): Método de seleção de pais ('roulette', 'sus' ou 'tournament')
+            replacement (str): Substituição da população: 'plus' (μ+λ, sobrevivem os melhores
+                entre pais e filhos), 'comma' (μ,λ, sobrevivem apenas filhos além da elite)
+                ou 'steady_state' (poucos filhos por passo, cada um substituindo in place
+                um indivíduo pior)
+            elitism (int): Número de melhores pais mantidos na substituição 'comma'
+                (na substituição 'plus' os melhores sempre sobrevivem)
+            dist_matrix (numpy.ndarray): Matriz de distâncias já calculada (por exemplo,
+                em memória compartilhada); se None, as distâncias vêm do backend escolhido
+            metric (callable): Métrica vetorizada e simétrica metric(coords_a, coords_b);
+                None usa a distância euclidiana
+            distance_backend (str): Backend de distâncias: 'auto', 'matrix', 'on_demand' ou 'lru'
+            memory_budget (int): Memória máxima, em bytes, para a matriz completa no modo 'auto'
+            vectorized_metric (bool): Se False, metric recebe um único par de coordenadas
+                por chamada e, em instâncias grandes, usa o backend com cache LRU
+            seed: Semente do gerador de números aleatórios do algoritmo: None, int,
+                numpy.random.SeedSequence ou numpy.random.Generator (usado diretamente)
+            local_search (str): Busca local aplicada aos filhos (modo memético):
+                None, '2opt', 'oropt' ou 'both'
+            local_search_budget (int): Máximo de movimentos avaliados pela busca local
+                em cada geração
+            neighbor_k (int): Tamanho das listas de vizinhos mais próximos
+            construction_fraction (float): Fração da população inicial construída por
+                heurísticas (arestas gulosas e vizinho mais próximo) em vez de sorteada
+            time_limit (float): Tempo máximo de execução de run(), em segundos
+            max_evaluations (int): Máximo de avaliações de fitness
+            target_distance (float): Distância que, uma vez alcançada, encerra a execução
+            stagnation_generations (int): Encerra após esse número de gerações sem
+                melhora da melhor distância
+            deduplicate (bool): Se True, filhos que repetem (a menos de rotação e
+                sentido) um caminho da população ou outro filho não são avaliados
+                nem entram na população
+            steady_state_batch (int): Filhos gerados por passo no modo 'steady_state' (par)
+            steady_state_victim (str): Indivíduo substituído no modo 'steady_state':
+                'worst' (o pior da população) ou 'tournament' (o pior de um torneio
+                de tournament_size indivíduos)
         """
-        self.city_names = city_names
+        if crossover_method not in OPERADORES_CROSSOVER:
+            raise ValueError(f"Operador de crossover desconhecido: {crossover_method}")
+        if selection_method not in OPERADORES_SELECAO:
+            raise ValueError(f"Método de seleção desconhecido: {selection_method}")
+        if replacement not in ('plus', 'comma', 'steady_state'):
+            raise ValueError(f"Modo de substituição desconhecido: {replacement}")
+        if local_search not in (None, '2opt', 'oropt', 'both'):
+            raise ValueError(f"Busca local desconhecida: {local_search}")
+        if not 0 <= construction_fraction <= 1:
+            raise ValueError("construction_fraction deve estar entre 0 e 1")
+        if not 0 <= elitism <= population_size:
+            raise ValueError("elitism deve estar entre 0 e population_size")
+        if steady_state_victim not in ('worst', 'tournament'):
+            raise ValueError(f"Vítima do estado estacionário desconhecida: {steady_state_victim}")
+        if steady_state_batch < 2 or steady_state_batch % 2:
+            raise ValueError("steady_state_batch deve ser par e maior ou igual a 2")
+        if stagnation_generations is not None and stagnation_generations < 1:
+            raise ValueError("stagnation_generations deve ser positivo")
+
+        self.city_names = list(city_names)
         self.city_coordinates = city_coordinates
+        # Internamente as cidades são representadas pelos seus índices em city_names
+        if isinstance(city_coordinates, np.ndarray):
+            self.coordinates = np.asarray(city_coordinates, dtype=float)
+        else:
+            self.coordinates = np.array(
+                [city_coordinates[name] for name in self.city_names], dtype=float
+            )
+        self.metric = metric
+        # Com uma métrica própria ou uma matriz externa as coordenadas não definem as distâncias
+        self.custom_distances = metric is not None or dist_matrix is not None
+        self.oraculo = criar_oraculo(
+            self.coordinates, metric, distance_backend, memory_budget,
+            matrix=dist_matrix, vectorized_metric=vectorized_metric
+        )
+        # Matriz completa quando disponível; senão o próprio oráculo, também indexável como d[a, b]
+        self.dist_matrix = (
+            self.oraculo.matrix if isinstance(self.oraculo, MatrizDistancias) else self.oraculo
+        )
         self.population_size = population_size
         self.crossover_rate = crossover_rate
         self.mutation_rate = mutation_rate
         self.generations = generations
         self.tournament_size = tournament_size
+        self.unique_population = unique_population
+        self.crossover_method = crossover_method
+        self.crossover_operator = OPERADORES_CROSSOVER[crossover_method]
+        self.selection_method = selection_method
+        self.selection_operator = OPERADORES_SELECAO[selection_method]
+        if selection_method == 'tournament':
+            self.selection_operator = partial(self.selection_operator, tournament_size=tournament_size)
+        self.replacement = replacement
+        self.elitism = elitism
+        # Cada par de pais gera dois filhos
+        self.n_offspring = 2 * (int(crossover_rate * population_size) // 2)
+        if replacement == 'comma' and self.n_offspring + elitism < population_size:
+            raise ValueError(
+                "Na substituição 'comma' os filhos e a elite precisam preencher a população"
+            )
+        self.local_search = local_search
+        self.local_search_budget = local_search_budget
+        self.neighbor_k = neighbor_k
+        self.construction_fraction = construction_fraction
+        self.time_limit = time_limit
+        self.max_evaluations = max_evaluations
+        self.target_distance = target_distance
+        self.stagnation_generations = stagnation_generations
+        self.deduplicate = deduplicate
+        self.steady_state_batch = steady_state_batch
+        self.steady_state_victim = steady_state_victim
+        # Estruturas do modo estado estacionário e da deduplicação, criadas em iniciar()
+        self.heap = None
+        self._hash_buffer = None
+        self._slot_hashes = None
+        self._hash_counts = None
+        # Número de filhos descartados por repetirem um ciclo já presente
+        self.duplicates_discarded = 0
+        # Critério que encerrou a última execução de run() e gerações executadas
+        self.stop_reason = None
+        self.generations_run = 0
+        self.neighbors = None
+        self.grid = None
+        # Todo sorteio do algoritmo passa por este gerador, o que torna a execução reprodutível
+        self.rng = criar_gerador(seed)
+        # Cidades guardadas como inteiros de 16 bits sempre que os índices couberem
+        self.city_dtype = np.int16 if len(self.city_names) <= 2**15 else np.int32
+        self._population_buffer = None
+        # Número de caminhos efetivamente avaliados (distância calculada do zero)
+        self.fitness_evaluations = 0
+        # Número de movimentos avaliados pela busca local
+        self.local_search_evaluations = 0
+        # Tempo acumulado (s) de cada fase desde iniciar() e tempos da última geração
+        self.phase_times = dict.fromkeys(FASES, 0.0)
+        self.generation_times = dict.fromkeys(FASES, 0.0)
+
+    def distancia(self, path):
+        """
+        Calcula a distância total de um caminho codificado por índices.
+        
+        Args:
+            path (numpy.ndarray): Índices das cidades no caminho
+        
+        Returns:
+            float: Distância total do caminho
+        """
+        return float(self.oraculo.caminhos(np.asarray(path)[np.newaxis])[0])
+
+    def decodificar(self, path):
+        """
+        Converte um caminho de índices para a lista de nomes das cidades.
+        
+        Args:
+            path (numpy.ndarray): Índices das cidades no caminho
+        
+        Returns:
+            list: Nomes das cidades na ordem do caminho
+        """
+        return [self.city_names[i] for i in path]
+
     def gerar_populacao_inicial(self):
         """
         Gera população inicial de caminhos possíveis.
         
+        As permutações são sorteadas diretamente (argsort de uma matriz de números
+        aleatórios), sem enumerar todas as n! possibilidades.
+        
         Returns:
-            list: População inicial de caminhos
+            numpy.ndarray: População inicial, formato (population_size, n_cities)
         """
-        city_permutations = list(permutations(self.city_names))
-        random_indices = random.sample(range(len(city_permutations)), self.population_size)
-        return [list(city_permutations[i]) for i in random_indices]
+        n_cities = len(self.city_names)
+        population = np.argsort(self.rng.random((self.population_size, n_cities)), axis=1)
+        if self.unique_population:
+            if math.factorial(n_cities) < self.population_size:
+                raise ValueError("Tamanho da população maior que o número de caminhos possíveis")
 
-    def calcular_fitness(self, population):
+            # Remove repetidos e sorteia novamente apenas as linhas que faltam
+            _, first = np.unique(population, axis=0, return_index=True)
+            population = population[np.sort(first)]
+            while len(population) < self.population_size:
+                missing = self.population_size - len(population)
+                extra = np.argsort(self.rng.random((missing, n_cities)), axis=1)
+                population = np.concatenate((population, extra))
+                _, first = np.unique(population, axis=0, return_index=True)
+                population = population[np.sort(first)]
+
+        n_constructed = int(round(self.construction_fraction * self.population_size))
+        if n_constructed:
+            population[:n_constructed] = self.construir_caminhos(n_constructed)
+        return population
+
+    def vizinhos(self):
+        """
+        Retorna as listas de vizinhos mais próximos das cidades.
+        
+        As listas são calculadas uma única vez, pela grade espacial sobre as
+        coordenadas, em aproximadamente O(n log n). Com uma métrica própria (ou
+        uma matriz externa) e a matriz completa disponível, as listas vêm da
+        matriz; sem ela, a grade euclidiana serve como aproximação.
+        
+        Returns:
+            numpy.ndarray: Vizinhos de cada cidade, formato (n_cities, neighbor_k)
+        """
+        if self.neighbors is None:
+            self.grid = GradeEspacial(self.coordinates)
+            if self.custom_distances and isinstance(self.oraculo, MatrizDistancias):
+                self.neighbors = listas_vizinhos(self.dist_matrix, self.neighbor_k)
+            else:
+                self.neighbors = self.grid.k_vizinhos(self.neighbor_k)
+        return self.neighbors
+
+    def construir_caminhos(self, count):
         """
-        Calcula o fitness da população.
+        Constrói caminhos por heurísticas para semear a população inicial.
+        
+        O primeiro caminho vem da heurística de arestas gulosas; os demais, do
+        vizinho mais próximo partindo de cidades iniciais sorteadas. Com uma
+        métrica própria ou uma matriz externa, os comprimentos vêm do oráculo
+        de distâncias, e não das coordenadas.
         
         Args:
-            population (list): População de caminhos
+            count (int): Número de caminhos
         
         Returns:
-            numpy.ndarray: Probabilidades de fitness
+            numpy.ndarray: Caminhos construídos, formato (count, n_cities)
+        """
+        neighbors = self.vizinhos()
+        n_cities = len(self.city_names)
+        # A grade espacial só vale para a distância euclidiana das coordenadas
+        pares, grid = (self.oraculo.pares, None) if self.custom_distances else (None, self.grid)
+        tours = [tour_arestas_gulosas(self.coordinates, neighbors, pares)]
+        starts = self.rng.choice(n_cities, size=count - 1, replace=count - 1 > n_cities)
+        for start in starts:
+            tours.append(tour_vizinho_mais_proximo(self.coordinates, neighbors, start, grid, pares))
+        return np.array(tours)
+
+    def avaliar_populacao(self, population):
         """
-        distances = np.array([
-            distancia_total(path, self.city_coordinates) 
-            for path in population
-        ])
+        Calcula a distância de todos os caminhos da população em lote.
+        
+        Args:
+            population (numpy.ndarray): População de caminhos, formato (pop_size, n_cities)
         
-        fitness = np.max(distances) - distances
-        fitness_sum = np.sum(fitness)
+        Returns:
+            numpy.ndarray: Distância total de cada caminho
+        """
+        self.fitness_evaluations += len(population)
+        return self.oraculo.caminhos(population)
 
-        return fitness / fitness_sum if fitness_sum != 0 else np.ones(len(population)) / len(population)
-    def selecao_torneio(self, population):
+    def selecionar_pais(self, distances, n_parents):
         """
-        Método de seleção por torneio.
+        Seleciona os pais da geração com o método configurado.
         
         Args:
-            population (list): População de caminhos
+            distances (numpy.ndarray): Distância total de cada caminho
+            n_parents (int): Número de pais a selecionar
         
         Returns:
-            list: Caminho selecionado como o melhor do torneio
+            numpy.ndarray: Índices dos pais na população
         """
-        # Seleciona aleatoriamente tournament_size indivíduos
-        tournament_candidates = random.sample(population, self.tournament_size)
+        return self.selection_operator(distances, n_parents, self.rng)
+
+    def crossover(self, parents1, parents2, out=None):
+        """
+        Realiza o crossover de todos os pares de pais de uma só vez.
         
-        # Encontra o melhor (caminho com menor distância)
-        best_candidate = min(
-            tournament_candidates, 
-            key=lambda path: distancia_total(path, self.city_coordinates)
-        )
+        Args:
+            parents1 (numpy.ndarray): Primeiros pais, formato (n_pairs, n_cities)
+            parents2 (numpy.ndarray): Segundos pais, formato (n_pairs, n_cities)
+            out (numpy.ndarray): Buffer (2 * n_pairs, n_cities) onde escrever os filhos;
+                se None, um novo array é criado
+        
+        Returns:
+            numpy.ndarray: Filhos gerados, formato (2 * n_pairs, n_cities)
+        """
+        child1, child2 = self.crossover_operator(parents1, parents2, self.rng)
+        if out is None:
+            return np.concatenate((child1, child2))
+        out[:len(child1)] = child1
+        out[len(child1):] = child2
+        return out
+
+    def delta_troca(self, tour, i, j):
+        """
+        Calcula, em tempo constante, a variação de distância ao trocar duas cidades.
+        
+        Args:
+            tour (numpy.ndarray): Caminho de índices
+            i (int): Posição da primeira cidade
+            j (int): Posição da segunda cidade
         
-        return best_candidate
-    def selecao_roleta(self, population, fitness_probabilities):
+        Returns:
+            float: Distância nova menos a distância atual
         """
-        Seleção por roleta.
+        n = len(tour)
+        if i == j or n <= 3:
+            return 0.0
+        if i > j:
+            i, j = j, i
+        d = self.dist_matrix
+        a, b, c = tour[i - 1], tour[i], tour[(i + 1) % n]
+        e, f, g = tour[j - 1], tour[j], tour[(j + 1) % n]
+        if j == i + 1:
+            # Cidades vizinhas: ... a b f g ... -> ... a f b g ...
+            return d[a, f] + d[b, g] - d[a, b] - d[f, g]
+        if i == 0 and j == n - 1:
+            # Vizinhas pela aresta de retorno: b c ... e f -> f c ... e b
+            return d[e, b] + d[f, c] - d[e, f] - d[b, c]
+        return (d[a, f] + d[f, c] + d[e, b] + d[b, g]
+                - d[a, b] - d[b, c] - d[e, f] - d[f, g])
+
+    def delta_inversao(self, tour, i, j):
+        """
+        Calcula, em tempo constante, a variação de distância ao inverter o
+        trecho tour[i..j] (movimento 2-opt).
         
         Args:
-            population (list): População de caminhos
-            fitness_probabilities (numpy.ndarray): Probabilidades de fitness
+            tour (numpy.ndarray): Caminho de índices
+            i (int): Posição inicial do trecho
+            j (int): Posição final do trecho (inclusive)
         
         Returns:
-            list: Caminho selecionado
+            float: Distância nova menos a distância atual
         """
-        cumulative = fitness_probabilities.cumsum()
-        index = np.searchsorted(cumulative, random.random())
-        return population[index]
+        n = len(tour)
+        if i > j:
+            i, j = j, i
+        if j - i < 1 or j - i >= n - 1:
+            # Inverter um único ponto ou o ciclo inteiro não altera a distância
+            return 0.0
+        d = self.dist_matrix
+        a, b = tour[i - 1], tour[i]
+        e, f = tour[j], tour[(j + 1) % n]
+        return d[a, e] + d[b, f] - d[a, b] - d[e, f]
 
-    def crossover(self, parent1, parent2):
+    def aplicar_troca(self, tour, distance, i, j):
         """
-        Realiza crossover entre dois pais.
+        Troca duas cidades no caminho (in place) e atualiza sua distância.
         
         Args:
-            parent1 (list): Primeiro pai
-            parent2 (list): Segundo pai
+            tour (numpy.ndarray): Caminho de índices
+            distance (float): Distância atual do caminho
+            i (int): Posição da primeira cidade
+            j (int): Posição da segunda cidade
         
         Returns:
-            tuple: Dois filhos gerados
+            float: Nova distância do caminho
+        """
+        delta = self.delta_troca(tour, i, j)
+        tour[[i, j]] = tour[[j, i]]
+        return distance + delta
+
+    def aplicar_inversao(self, tour, distance, i, j):
         """
-        cut_point = random.randint(1, len(self.city_names) - 1)
+        Inverte o trecho tour[i..j] (in place) e atualiza a distância do caminho.
         
-        child1 = parent1[:cut_point] + [city for city in parent2 if city not in parent1[:cut_point]]
-        child2 = parent2[:cut_point] + [city for city in parent1 if city not in parent2[:cut_point]]
+        Args:
+            tour (numpy.ndarray): Caminho de índices
+            distance (float): Distância atual do caminho
+            i (int): Posição inicial do trecho
+            j (int): Posição final do trecho (inclusive)
         
-        return child1, child2
+        Returns:
+            float: Nova distância do caminho
+        """
+        if i > j:
+            i, j = j, i
+        delta = self.delta_inversao(tour, i, j)
+        tour[i:j + 1] = tour[i:j + 1][::-1]
+        return distance + delta
 
-    def mutacao(self, individual):
+    def mutacao_em_lote(self, tours, distances):
         """
-        Aplica mutação em um indivíduo.
+        Aplica a mutação por troca a um lote de indivíduos já avaliados.
+        
+        Os sorteios de quem sofre mutação e das posições trocadas são feitos de
+        uma vez, em arrays. A variação de distância de cada indivíduo é
+        calculada sobre as (até quatro) arestas que tocam as posições trocadas,
+        contando uma única vez as arestas repetidas quando as posições são
+        vizinhas.
         
         Args:
-            individual (list): Caminho a ser mutado
+            tours (numpy.ndarray): Caminhos, formato (m, n_cities) (alterados in place)
+            distances (numpy.ndarray): Distâncias dos caminhos (atualizadas in place)
         
         Returns:
-            list: Caminho mutado
+            numpy.ndarray: Índices dos caminhos alterados
         """
-        i, j = random.sample(range(len(individual)), 2)
-        individual[i], individual[j] = individual[j], individual[i]
-        return individual
+        n = tours.shape[1]
+        rows = np.flatnonzero(self.rng.random(len(tours)) < self.mutation_rate)
+        if n < 2 or not len(rows):
+            return rows[:0]
+        i = self.rng.integers(0, n, size=len(rows))
+        j = (i + self.rng.integers(1, n, size=len(rows))) % n
 
-    def run(self):
+        # Arestas k = (tour[k], tour[k + 1]) afetadas pela troca
+        edges = np.sort(np.stack((i - 1, i, j - 1, j), axis=1) % n, axis=1)
+        repeated = np.zeros(edges.shape, dtype=bool)
+        repeated[:, 1:] = edges[:, 1:] == edges[:, :-1]
+        selected = rows[:, np.newaxis]
+
+        def comprimentos():
+            lengths = self.dist_matrix[tours[selected, edges], tours[selected, (edges + 1) % n]]
+            return np.where(repeated, 0.0, lengths)
+
+        before = comprimentos()
+        tours[rows, i], tours[rows, j] = tours[rows, j], tours[rows, i]
+        distances[rows] += (comprimentos() - before).sum(axis=1)
+        return rows
+
+    def busca_local(self, tours, distances, budget=None):
         """
-        Executa o algoritmo genético.
+        Aplica a busca local configurada aos caminhos, dentro do orçamento da geração.
+        
+        Os caminhos mais curtos são melhorados primeiro; a busca para quando o
+        orçamento de movimentos avaliados se esgota.
+        
+        Args:
+            tours (numpy.ndarray): Caminhos a melhorar (alterados in place)
+            distances (numpy.ndarray): Distâncias dos caminhos (atualizadas in place)
+            budget (int): Movimentos que ainda podem ser avaliados (se None,
+                local_search_budget); o estado estacionário divide o orçamento
+                de uma geração entre os seus passos
         
         Returns:
-            tuple: Melhor caminho e menor distância
+            tuple: Índices dos caminhos melhorados (os únicos alterados) e orçamento restante
+        """
+        neighbors = self.vizinhos()
+        operators = {
+            '2opt': (dois_opt,),
+            'oropt': (or_opt,),
+            'both': (dois_opt, or_opt),
+        }[self.local_search]
+
+        budget = self.local_search_budget if budget is None else budget
+        improved = []
+        for k in np.argsort(distances):
+            if not np.isfinite(distances[k]):
+                # Filhos descartados (repetidos) ficam no fim da ordenação
+                break
+            start = distances[k]
+            for operator in operators:
+                if budget <= 0:
+                    break
+                distances[k], used = operator(
+                    tours[k], distances[k], self.dist_matrix, neighbors, budget
+                )
+                budget -= used
+                self.local_search_evaluations += used
+            if distances[k] < start:
+                improved.append(k)
+            if budget <= 0:
+                break
+        return np.asarray(improved, dtype=np.intp), max(budget, 0)
+
+    def selecionar_sobreviventes(self, population, distances):
+        """
+        Seleciona os sobreviventes da geração e os reposiciona in place.
+        
+        Os buffers contêm a população atual nas primeiras population_size linhas
+        e os filhos nas seguintes. Os melhores são escolhidos por seleção parcial
+        (argpartition), sem ordenar tudo, e apenas os filhos sobreviventes são
+        copiados para as vagas dos pais descartados.
+        
+        Args:
+            population (numpy.ndarray): Buffer de pais e filhos, formato (μ + λ, n_cities)
+            distances (numpy.ndarray): Buffer de distâncias alinhado com population
+        """
+        mu = self.population_size
+        if len(distances) <= mu:
+            return
+
+        if self.replacement == 'plus':
+            keep = np.argpartition(distances, mu - 1)[:mu]
+        else:
+            elite = np.empty(0, dtype=int)
+            if self.elitism:
+                elite = np.argpartition(distances[:mu], self.elitism - 1)[:self.elitism]
+            needed = mu - self.elitism
+            children = mu + np.argpartition(distances[mu:], needed - 1)[:needed] if needed else elite[:0]
+            discarded = np.isinf(distances[children])
+            if discarded.any():
+                # Faltam filhos válidos: as vagas vão para os melhores pais fora da elite
+                order = np.argsort(distances[:mu])
+                order = order[~np.isin(order, elite)][:int(discarded.sum())]
+                children = np.concatenate((children[~discarded], order))
+            keep = np.concatenate((elite, children))
+
+        kept = np.zeros(len(distances), dtype=bool)
+        kept[keep] = True
+        free_slots = np.flatnonzero(~kept[:mu])
+        incoming = mu + np.flatnonzero(kept[mu:])
+        population[free_slots] = population[incoming]
+        distances[free_slots] = distances[incoming]
+        if self._hash_buffer is not None:
+            self._hash_buffer[free_slots] = self._hash_buffer[incoming]
+
+    def iniciar(self):
+        """
+        Cria e avalia a população inicial, preparando os buffers da evolução.
+        
+        A distância de cada indivíduo é guardada junto dele (self.distances) e
+        reaproveitada enquanto ele sobreviver; apenas os descendentes novos são
+        avaliados a cada geração.
+        """
+        self.fitness_evaluations = 0
+        self.local_search_evaluations = 0
+        self.duplicates_discarded = 0
+        self.phase_times = dict.fromkeys(FASES, 0.0)
+        self.generation_times = dict.fromkeys(FASES, 0.0)
+        mu = self.population_size
+
+        # Buffers pré-alocados e reaproveitados em todas as gerações: pais nas
+        # primeiras mu linhas, filhos nas seguintes, e os pais sorteados para o crossover.
+        # No estado estacionário só cabem os filhos de um passo
+        steady = self.replacement == 'steady_state'
+        n_children = self.steady_state_batch if steady else self.n_offspring
+        n_cities = len(self.city_names)
+        self._population_buffer = np.empty((mu + n_children, n_cities), dtype=self.city_dtype)
+        self._distance_buffer = np.empty(mu + n_children)
+        self._parents_buffer = np.empty((n_children, n_cities), dtype=self.city_dtype)
+        self._population_buffer[:mu] = self.gerar_populacao_inicial()
+        self._distance_buffer[:mu] = self.avaliar_populacao(self._population_buffer[:mu])
+        self.population, self.distances = self._population_buffer[:mu], self._distance_buffer[:mu]
+
+        # Hash de cada caminho, alinhado com os buffers e calculado uma única vez:
+        # só os filhos são reduzidos a hash a cada geração
+        if self.deduplicate:
+            self._hash_buffer = np.empty(mu + n_children, dtype=np.uint64)
+            self._hash_buffer[:mu] = hash_caminhos(self.population)
+            self._slot_hashes = self._hash_buffer[:mu]
+        if steady:
+            self.heap = HeapIndexado(self.distances)
+            if self.deduplicate:
+                self._hash_counts = Counter(self._slot_hashes.tolist())
+
+    def evoluir_geracao(self):
         """
-        population = self.gerar_populacao_inicial()
+        Executa uma geração: seleção, crossover, mutação e escolha dos sobreviventes.
         
-        for _ in range(self.generations):
-            fitness_probabilities = self.calcular_fitness(population)
-            
-            parents = [
-                self.selecao_roleta(population, fitness_probabilities)
-                for _ in range(int(self.crossover_rate * self.population_size))
-            ]
+        Cada fase é cronometrada com time.perf_counter (algumas chamadas por
+        geração, custo desprezível); os tempos ficam em self.generation_times
+        e são acumulados em self.phase_times.
+        """
+        if self.replacement == 'steady_state':
+            self.evoluir_estado_estacionario()
+            return
+        n_pairs = self.n_offspring // 2
+        if not n_pairs:
+            return
+        mu = self.population_size
+        offspring = self._population_buffer[mu:]
+        offspring_distances = self._distance_buffer[mu:]
+        times = self.generation_times
+        clock = time.perf_counter
 
-            offspring = []
-            for i in range(0, len(parents), 2):
-                if i + 1 < len(parents):
-                    child1, child2 = self.crossover(parents[i], parents[i+1])
-                    
-                    child1 = self.mutacao(child1) if random.random() < self.mutation_rate else child1
-                    child2 = self.mutacao(child2) if random.random() < self.mutation_rate else child2
-                    
-                    offspring.extend([child1, child2])
+        # Um único vetor de distâncias serve à seleção e à escolha dos sobreviventes
+        t0 = clock()
+        parents = np.take(self.population, self.selecionar_pais(self.distances, 2 * n_pairs),
+                          axis=0, out=self._parents_buffer)
+        t1 = clock()
+        self.crossover(parents[0::2], parents[1::2], out=offspring)
+        t2 = clock()
+        if self.deduplicate:
+            fresh = self.filhos_ineditos(offspring)
+            self.duplicates_discarded += int(np.count_nonzero(~fresh))
+            offspring_distances[~fresh] = np.inf
+            offspring_distances[fresh] = self.avaliar_populacao(offspring[fresh])
+        else:
+            offspring_distances[:] = self.avaliar_populacao(offspring)
+        t3 = clock()
+        # A mutação atualiza a distância já calculada sem reavaliar o caminho
+        changed = self.mutacao_em_lote(offspring, offspring_distances)
+        t4 = clock()
+        if self.local_search:
+            improved, _ = self.busca_local(offspring, offspring_distances)
+            changed = np.union1d(changed, improved)
+        t5 = clock()
+        if self.deduplicate:
+            # A mutação e a busca local podem ter recriado um ciclo já presente;
+            # só os filhos alterados por elas voltam a ser reduzidos a hash
+            valid = np.isfinite(offspring_distances)
+            repeated = valid & ~self.filhos_ineditos(offspring, valid, changed)
+            self.duplicates_discarded += int(np.count_nonzero(repeated))
+            offspring_distances[repeated] = np.inf
+        self.selecionar_sobreviventes(self._population_buffer, self._distance_buffer)
+        t6 = clock()
 
-            population += offspring
-            population.sort(key=lambda path: distancia_total(path, self.city_coordinates))
-            population = population[:self.population_size]
+        times['selection'], times['crossover'], times['fitness'] = t1 - t0, t2 - t1, t3 - t2
+        times['mutation'], times['local_search'], times['survivors'] = t4 - t3, t5 - t4, t6 - t5
+        for phase in FASES:
+            self.phase_times[phase] += times[phase]
 
-        best_path = min(population, key=lambda path: distancia_total(path, self.city_coordinates))
-        best_distance = distancia_total(best_path, self.city_coordinates)
+    def evoluir_estado_estacionario(self):
+        """
+        Executa uma geração do modo estado estacionário.
         
-        return best_path, best_distance
\ No newline at end of file
+        Uma geração equivale a n_offspring filhos, produzidos em passos de
+        steady_state_batch. A cada passo os filhos são gerados, avaliados e
+        inseridos um a um: cada filho substitui a vítima (o pior da população,
+        dado pelo heap indexado, ou o perdedor de um torneio) se for melhor que
+        ela. A substituição custa O(log μ), sem ordenar nem copiar a população,
+        e a população está sempre pronta para consulta entre dois passos.
+        
+        Os pais de todos os passos são sorteados de uma vez, sobre as
+        distâncias do início da geração (uma única montagem da distribuição
+        de seleção); uma posição substituída no meio da geração cede o seu
+        novo ocupante. O orçamento da busca local vale para a geração inteira.
+        """
+        mu = self.population_size
+        batch = self.steady_state_batch
+        steps = max(1, self.n_offspring // batch)
+        children = self._population_buffer[mu:]
+        children_distances = self._distance_buffer[mu:]
+        times = dict.fromkeys(FASES, 0.0)
+        clock = time.perf_counter
+        budget = self.local_search_budget
+
+        t0 = clock()
+        selected = self.selecionar_pais(self.distances, steps * batch)
+        times['selection'] += clock() - t0
+        for step in range(steps):
+            t0 = clock()
+            parents = np.take(self.population, selected[step * batch:(step + 1) * batch],
+                              axis=0, out=self._parents_buffer)
+            t1 = clock()
+            self.crossover(parents[0::2], parents[1::2], out=children)
+            t2 = clock()
+            hashes = None
+            if self.deduplicate:
+                hashes = hash_caminhos(children)
+                listed = hashes.tolist()
+                fresh = np.array([h not in self._hash_counts and h not in listed[:k]
+                                  for k, h in enumerate(listed)])
+                self.duplicates_discarded += int(np.count_nonzero(~fresh))
+                children_distances[~fresh] = np.inf
+                children_distances[fresh] = self.avaliar_populacao(children[fresh])
+            else:
+                children_distances[:] = self.avaliar_populacao(children)
+            t3 = clock()
+            changed = self.mutacao_em_lote(children, children_distances)
+            t4 = clock()
+            if self.local_search and budget > 0:
+                improved, budget = self.busca_local(children, children_distances, budget)
+                changed = np.union1d(changed, improved)
+            t5 = clock()
+            if hashes is not None and len(changed):
+                # Só os filhos alterados pela mutação ou pela busca local voltam ao hash
+                hashes[changed] = hash_caminhos(children[changed])
+            self.inserir_filhos(children, children_distances, hashes)
+            t6 = clock()
+            times['selection'] += t1 - t0
+            times['crossover'] += t2 - t1
+            times['fitness'] += t3 - t2
+            times['mutation'] += t4 - t3
+            times['local_search'] += t5 - t4
+            times['survivors'] += t6 - t5
+
+        self.generation_times.update(times)
+        for phase in FASES:
+            self.phase_times[phase] += times[phase]
+
+    def escolher_vitima(self):
+        """
+        Escolhe o indivíduo a ser substituído no modo estado estacionário.
+        
+        Returns:
+            int: Índice do indivíduo na população
+        """
+        if self.steady_state_victim == 'worst':
+            return self.heap.topo()
+        candidates = self.rng.integers(0, self.population_size, size=self.tournament_size)
+        return int(candidates[np.argmax(self.distances[candidates])])
+
+    def substituir(self, slot, tour, distance, tour_hash=None):
+        """
+        Coloca um caminho em uma posição da população, mantendo o heap e os
+        hashes do estado estacionário atualizados.
+        
+        Args:
+            slot (int): Posição na população
+            tour (numpy.ndarray): Novo caminho
+            distance (float): Distância do novo caminho
+            tour_hash (int): Hash do novo caminho (calculado se None)
+        """
+        self.population[slot] = tour
+        self.distances[slot] = distance
+        if self.heap is not None:
+            self.heap.atualizar(slot, distance)
+        if self._hash_counts is not None:
+            if tour_hash is None:
+                tour_hash = int(hash_caminhos(tour)[0])
+            old = int(self._slot_hashes[slot])
+            self._hash_counts[old] -= 1
+            if not self._hash_counts[old]:
+                del self._hash_counts[old]
+            self._slot_hashes[slot] = tour_hash
+            self._hash_counts[tour_hash] += 1
+
+    def inserir_filhos(self, children, distances, hashes=None):
+        """
+        Insere filhos já avaliados na população, cada um no lugar da vítima
+        escolhida, desde que seja melhor que ela.
+        
+        Args:
+            children (numpy.ndarray): Filhos, formato (m, n_cities)
+            distances (numpy.ndarray): Distâncias dos filhos
+            hashes (numpy.ndarray): Hashes atuais dos filhos (calculados se None)
+        """
+        if self._hash_counts is None:
+            hashes = None
+        elif hashes is None:
+            hashes = hash_caminhos(children).tolist()
+        else:
+            hashes = hashes.tolist()
+        for k in np.argsort(distances):
+            if not np.isfinite(distances[k]):
+                break
+            # A mutação e a busca local podem ter recriado um ciclo já presente
+            if hashes is not None and hashes[k] in self._hash_counts:
+                continue
+            victim = self.escolher_vitima()
+            if distances[k] < self.distances[victim]:
+                self.substituir(victim, children[k], distances[k],
+                                None if hashes is None else hashes[k])
+
+    def filhos_ineditos(self, children, candidates=None, changed=None):
+        """
+        Identifica os filhos que representam ciclos ainda ausentes da população.
+        
+        Só os filhos são reduzidos a hash (pelo conjunto de arestas, ver
+        hash_caminhos), gravado no buffer de hashes ao lado deles; os hashes
+        dos pais já estão guardados. Um filho é repetido quando seu hash
+        aparece entre os pais ou em um filho candidato anterior.
+        
+        Args:
+            children (numpy.ndarray): Filhos, formato (λ, n_cities)
+            candidates (numpy.ndarray): Máscara dos filhos que ainda concorrem;
+                os demais nunca são inéditos (se None, todos concorrem)
+            changed (numpy.ndarray): Índices dos filhos alterados desde o último
+                cálculo; só eles são reduzidos a hash (se None, todos)
+        
+        Returns:
+            numpy.ndarray: Máscara booleana dos filhos inéditos
+        """
+        hashes = self._hash_buffer[self.population_size:]
+        if changed is None:
+            hashes[:] = hash_caminhos(children)
+        elif len(changed):
+            hashes[changed] = hash_caminhos(children[changed])
+        indices = np.arange(len(hashes)) if candidates is None else np.flatnonzero(candidates)
+        _, first = np.unique(hashes[indices], return_index=True)
+        fresh = np.zeros(len(hashes), dtype=bool)
+        fresh[indices[first]] = True
+        fresh &= ~np.isin(hashes, self._slot_hashes)
+        return fresh
+
+    def estatisticas_geracao(self, generation):
+        """
+        Resume o estado da população ao fim de uma geração.
+        
+        A diversidade é a fração de distâncias distintas na população, um
+        indicador barato (O(μ log μ)) de convergência: tende a 1/μ quando todos
+        os indivíduos representam o mesmo ciclo.
+        
+        Args:
+            generation (int): Número da geração
+        
+        Returns:
+            dict: generation, best, mean, std, diversity, evaluations e timings (s por fase)
+        """
+        return {
+            'generation': generation,
+            'best': float(np.min(self.distances)),
+            'mean': float(np.mean(self.distances)),
+            'std': float(np.std(self.distances)),
+            'diversity': len(np.unique(self.distances)) / len(self.distances),
+            'evaluations': self.fitness_evaluations,
+            'timings': dict(self.generation_times),
+        }
+
+    def bytes_memoria(self):
+        """
+        Informa a memória ocupada pelas estruturas do algoritmo, em bytes.
+        
+        Returns:
+            dict: Bytes de cada estrutura ('population', 'distances', 'parents',
+                'hashes', 'neighbors', 'distance_oracle') e o total ('total')
+        """
+        memory = {
+            'population': 0 if self._population_buffer is None else self._population_buffer.nbytes,
+            'distances': 0 if self._population_buffer is None else self._distance_buffer.nbytes,
+            'parents': 0 if self._population_buffer is None else self._parents_buffer.nbytes,
+            'hashes': 0 if self._hash_buffer is None else self._hash_buffer.nbytes,
+            'neighbors': 0 if self.neighbors is None else self.neighbors.nbytes,
+            'distance_oracle': self.oraculo.bytes_memoria(),
+        }
+        memory['total'] = sum(memory.values())
+        return memory
+
+    def melhores(self, k):
+        """
+        Retorna cópias dos k melhores indivíduos da população atual.
+        
+        Args:
+            k (int): Número de indivíduos
+        
+        Returns:
+            tuple: Caminhos (k, n_cities) e suas distâncias
+        """
+        k = min(k, self.population_size)
+        best = np.argpartition(self.distances, k - 1)[:k]
+        return self.population[best].copy(), self.distances[best].copy()
+
+    def fluxos_filhos(self, count):
+        """
+        Deriva sementes independentes do gerador do algoritmo, para
+        trabalhadores em paralelo (por exemplo, buscas locais ou ilhas).
+        
+        Args:
+            count (int): Número de fluxos
+        
+        Returns:
+            list: numpy.random.SeedSequence filhas
+        """
+        return fluxos_independentes(self.rng, count)
+
+    def receber_migrantes(self, tours, distances):
+        """
+        Substitui os piores indivíduos da população por migrantes já avaliados.
+        
+        Args:
+            tours (numpy.ndarray): Caminhos dos migrantes, formato (k, n_cities)
+            distances (numpy.ndarray): Distâncias dos migrantes
+        """
+        k = min(len(tours), self.population_size)
+        if not k:
+            return
+        worst = np.argpartition(self.distances, -k)[-k:]
+        if self.heap is None:
+            self.population[worst] = tours[:k]
+            self.distances[worst] = distances[:k]
+            if self._slot_hashes is not None:
+                self._slot_hashes[worst] = hash_caminhos(tours[:k])
+            return
+        for slot, tour, distance in zip(worst, tours[:k], distances[:k]):
+            self.substituir(int(slot), tour, float(distance))
+
+    def resultado(self):
+        """
+        Retorna o melhor indivíduo da população atual.
+        
+        Returns:
+            tuple: Melhor caminho (nomes das cidades) e menor distância
+        """
+        best_index = int(np.argmin(self.distances))
+        return self.decodificar(self.population[best_index]), float(self.distances[best_index])
+
+    def criterio_parada(self, generation, elapsed, best, last_improvement):
+        """
+        Verifica os critérios de parada ao fim de uma geração.
+        
+        Os orçamentos são verificados entre gerações, então a execução pode
+        ultrapassá-los no máximo pelo custo de uma geração.
+        
+        Args:
+            generation (int): Gerações já executadas
+            elapsed (float): Tempo decorrido desde o início de run(), em segundos
+            best (float): Melhor distância encontrada
+            last_improvement (int): Geração da última melhora da melhor distância
+        
+        Returns:
+            str: Critério atendido ('target_distance', 'time_limit', 'max_evaluations',
+                'stagnation' ou 'generations') ou None para continuar
+        """
+        if self.target_distance is not None and best <= self.target_distance:
+            return 'target_distance'
+        if self.time_limit is not None and elapsed >= self.time_limit:
+            return 'time_limit'
+        if self.max_evaluations is not None and self.fitness_evaluations >= self.max_evaluations:
+            return 'max_evaluations'
+        if (self.stagnation_generations is not None
+                and generation - last_improvement >= self.stagnation_generations):
+            return 'stagnation'
+        if generation >= self.generations:
+            return 'generations'
+        return None
+
+    def run(self, callback=None, log_file=None):
+        """
+        Executa o algoritmo genético até o número de gerações ou até que um
+        critério de parada seja atendido; o critério fica em self.stop_reason.
+        
+        Args:
+            callback (callable): Função chamada ao fim de cada geração com o
+                dicionário de estatisticas_geracao
+            log_file (str): Arquivo JSONL onde gravar uma linha com as
+                estatísticas de cada geração
+        
+        Returns:
+            tuple: Melhor caminho (nomes das cidades) e menor distância
+        """
+        start = time.perf_counter()
+        self.iniciar()
+        best = float(np.min(self.distances))
+        last_improvement = 0
+        generation = 0
+        log = open(log_file, 'a', encoding='utf-8') if log_file else None
+        try:
+            self.stop_reason = self.criterio_parada(0, time.perf_counter() - start, best, 0)
+            while self.stop_reason is None:
+                generation += 1
+                self.evoluir_geracao()
+                current = float(np.min(self.distances))
+                if current < best:
+                    best, last_improvement = current, generation
+                # As estatísticas só são calculadas quando alguém vai consumi-las
+                if callback or log:
+                    record = self.estatisticas_geracao(generation)
+                    if callback:
+                        callback(record)
+                    if log:
+                        log.write(json.dumps(record) + '\n')
+                self.stop_reason = self.criterio_parada(
+                    generation, time.perf_counter() - start, best, last_improvement
+                )
+        finally:
+            if log:
+                log.close()
+        self.generations_run = generation
+        return self.resultado()
@@ -0,0 +1,76 @@
+import numpy as np
+
+def _camadas_por_cardinalidade(m):
+    """
+    Agrupa os subconjuntos de m elementos (máscaras de bits) pelo tamanho.
+
+    Args:
+        m (int): Número de elementos
+
+    Returns:
+        list: Para cada tamanho s (0..m), array com as máscaras de s elementos
+    """
+    masks = np.arange(1 << m)
+    sizes = np.zeros(1 << m, dtype=np.int64)
+    for bit in range(m):
+        sizes += (masks >> bit) & 1
+    order = np.argsort(sizes, kind='stable')
+    bounds = np.searchsorted(sizes[order], np.arange(m + 2))
+    return [order[bounds[s]:bounds[s + 1]] for s in range(m + 1)]
+
+def held_karp(dist_matrix):
+    """
+    Resolve o TSP de forma exata por programação dinâmica sobre subconjuntos
+    (Held-Karp), em O(2^n n^2) operações e O(2^n n) de memória.
+
+    A cidade 0 é a origem. cost[mask, j] é o menor custo de sair de 0,
+    visitar exatamente as cidades de mask e terminar em j. As máscaras são
+    processadas por cardinalidade; dentro de uma camada, o cálculo para cada
+    cidade final j é vetorizado sobre todas as máscaras que contêm j.
+
+    Args:
+        dist_matrix (numpy.ndarray): Matriz de distâncias, formato (n, n)
+
+    Returns:
+        tuple: Caminho ótimo (índices, começando em 0) e sua distância
+    """
+    d = np.asarray(dist_matrix, dtype=float)
+    n = len(d)
+    if n <= 1:
+        return np.zeros(n, dtype=int), 0.0
+    if n == 2:
+        return np.arange(2), float(d[0, 1] + d[1, 0])
+
+    # Máscaras sobre as cidades 1..n-1 (bit j representa a cidade j + 1)
+    m = n - 1
+    inner = d[1:, 1:]
+    cost = np.full((1 << m, m), np.inf)
+    parent = np.full((1 << m, m), -1, dtype=np.int8 if m < 128 else np.int16)
+    singles = 1 << np.arange(m)
+    cost[singles, np.arange(m)] = d[0, 1:]
+
+    for layer in _camadas_por_cardinalidade(m)[2:]:
+        for j in range(m):
+            masks = layer[(layer >> j) & 1 == 1]
+            previous = cost[masks ^ (1 << j)] + inner[:, j]
+            best = np.argmin(previous, axis=1)
+            cost[masks, j] = previous[np.arange(len(masks)), best]
+            parent[masks, j] = best
+
+    full = (1 << m) - 1
+    totals = cost[full] + d[1:, 0]
+    last = int(np.argmin(totals))
+    distance = float(totals[last])
+
+    # Reconstrói o caminho de trás para frente pelos predecessores
+    tour = [last + 1]
+    mask = full
+    while True:
+        previous = int(parent[mask, last])
+        mask ^= 1 << last
+        if previous < 0:
+            break
+        tour.append(previous + 1)
+        last = previous
+    tour.append(0)
+    return np.array(tour[::-1]), distance
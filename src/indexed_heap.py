@@ -0,0 +1,83 @@
+class HeapIndexado:
+    """
+    Heap de máximo indexado sobre os valores de itens numerados 0..n-1.
+
+    Além do heap, guarda a posição de cada item nele, o que permite alterar o
+    valor de qualquer item em O(log n) e consultar o maior em O(1). Usado no
+    modo estado estacionário para achar o pior indivíduo da população.
+    """
+    def __init__(self, values):
+        """
+        Constrói o heap em O(n).
+
+        Args:
+            values (iterable): Valor inicial de cada item
+        """
+        self.values = [float(value) for value in values]
+        self.heap = list(range(len(self.values)))
+        self.position = list(range(len(self.values)))
+        for i in reversed(range(len(self.heap) // 2)):
+            self._descer(i)
+
+    def __len__(self):
+        return len(self.heap)
+
+    def topo(self):
+        """
+        Returns:
+            int: Item de maior valor
+        """
+        return self.heap[0]
+
+    def valor(self, item):
+        """
+        Args:
+            item (int): Item consultado
+
+        Returns:
+            float: Valor atual do item
+        """
+        return self.values[item]
+
+    def atualizar(self, item, value):
+        """
+        Altera o valor de um item e restaura a propriedade do heap.
+
+        Args:
+            item (int): Item alterado
+            value (float): Novo valor
+        """
+        old = self.values[item]
+        self.values[item] = float(value)
+        if value > old:
+            self._subir(self.position[item])
+        elif value < old:
+            self._descer(self.position[item])
+
+    def _trocar(self, i, j):
+        heap = self.heap
+        heap[i], heap[j] = heap[j], heap[i]
+        self.position[heap[i]] = i
+        self.position[heap[j]] = j
+
+    def _subir(self, i):
+        heap, values = self.heap, self.values
+        while i > 0:
+            parent = (i - 1) // 2
+            if values[heap[i]] <= values[heap[parent]]:
+                break
+            self._trocar(i, parent)
+            i = parent
+
+    def _descer(self, i):
+        heap, values = self.heap, self.values
+        n = len(heap)
+        while True:
+            largest = i
+            for child in (2 * i + 1, 2 * i + 2):
+                if child < n and values[heap[child]] > values[heap[largest]]:
+                    largest = child
+            if largest == i:
+                break
+            self._trocar(i, largest)
+            i = largest
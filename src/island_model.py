@@ -0,0 +1,174 @@
+import queue
+import multiprocessing as mp
+from multiprocessing import shared_memory
+import numpy as np
+from .distance_calculator import criar_oraculo, MatrizDistancias
+from .genetic_algorithm import AlgoritmoGenetico
+from .random_streams import sequencia_sementes
+
+# Critérios de parada de run() que o modelo de ilhas não aplica
+CRITERIOS_PARADA = ('time_limit', 'max_evaluations', 'target_distance', 'stagnation_generations')
+
+def destino_migracao(island, epoch, n_islands, topology, topology_seed):
+    """
+    Define para qual ilha uma ilha envia seus migrantes numa migração.
+
+    Na topologia 'ring' a ilha i envia sempre para i + 1. Na 'random' cada
+    migração sorteia um novo anel com uma semente comum a todas as ilhas, de
+    modo que todas concordam sobre o destino e cada ilha recebe exatamente
+    um grupo de migrantes.
+
+    Args:
+        island (int): Índice da ilha de origem
+        epoch (int): Número da migração
+        n_islands (int): Número de ilhas
+        topology (str): 'ring' ou 'random'
+        topology_seed (int): Semente comum usada na topologia 'random'
+
+    Returns:
+        int: Índice da ilha de destino
+    """
+    if topology == 'ring':
+        return (island + 1) % n_islands
+    order = np.random.default_rng([topology_seed, epoch]).permutation(n_islands)
+    position = int(np.flatnonzero(order == island)[0])
+    return int(order[(position + 1) % n_islands])
+
+def _trabalhador_ilha(island, seed, shm_name, shape, dtype, city_names, city_coordinates,
+                      ga_kwargs, n_islands, migration_interval, migration_size,
+                      topology, topology_seed, inboxes, results):
+    """
+    Evolui uma ilha em um processo separado, trocando migrantes pelas filas.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name) if shm_name else None
+    try:
+        dist_matrix = np.ndarray(shape, dtype=dtype, buffer=shm.buf) if shm else None
+        ga = AlgoritmoGenetico(city_names, city_coordinates, dist_matrix=dist_matrix,
+                               seed=seed, **ga_kwargs)
+        ga.iniciar()
+        for generation in range(1, ga.generations + 1):
+            ga.evoluir_geracao()
+            if n_islands > 1 and generation % migration_interval == 0 and generation < ga.generations:
+                epoch = generation // migration_interval
+                target = destino_migracao(island, epoch, n_islands, topology, topology_seed)
+                inboxes[target].put(ga.melhores(migration_size))
+                ga.receber_migrantes(*inboxes[island].get())
+
+        best = int(np.argmin(ga.distances))
+        results.put((island, ga.population[best].copy(), float(ga.distances[best]),
+                     ga.fitness_evaluations))
+        # As referências ao buffer compartilhado precisam sair de escopo antes do close
+        del ga, dist_matrix
+    finally:
+        if shm:
+            shm.close()
+
+def executar_ilhas(city_names, city_coordinates,
+                   n_islands=4,
+                   migration_interval=10,
+                   migration_size=2,
+                   topology='ring',
+                   **ga_kwargs):
+    """
+    Executa o modelo de ilhas: várias subpopulações evoluem em processos
+    separados e trocam seus melhores indivíduos periodicamente.
+
+    Quando o backend de distâncias é a matriz completa, ela é calculada uma
+    única vez e compartilhada entre os processos em memória compartilhada,
+    somente para leitura; os demais backends usam apenas as coordenadas e são
+    criados em cada processo.
+
+    Cada ilha recebe um fluxo de números aleatórios independente, derivado
+    por SeedSequence.spawn da semente em ga_kwargs['seed']; com a mesma
+    semente, a execução é reprodutível.
+
+    Todas as ilhas executam ga_kwargs['generations'] gerações: as migrações
+    exigem que as ilhas avancem juntas, então os critérios de parada de
+    AlgoritmoGenetico.run (time_limit, max_evaluations, target_distance e
+    stagnation_generations) não são aceitos.
+
+    Args:
+        city_names (list): Nomes das cidades
+        city_coordinates (dict): Coordenadas das cidades (ou array (n, 2) na ordem de city_names)
+        n_islands (int): Número de ilhas (processos)
+        migration_interval (int): Gerações entre migrações
+        migration_size (int): Número de melhores indivíduos enviados em cada migração
+        topology (str): Topologia de migração ('ring' ou 'random')
+        **ga_kwargs: Parâmetros repassados ao AlgoritmoGenetico de cada ilha
+
+    Returns:
+        tuple: Melhor caminho (nomes das cidades) e menor distância entre todas as ilhas
+
+    Raises:
+        ValueError: Se ga_kwargs contiver um critério de parada
+    """
+    if topology not in ('ring', 'random'):
+        raise ValueError(f"Topologia de migração desconhecida: {topology}")
+    if n_islands < 1 or migration_interval < 1:
+        raise ValueError("n_islands e migration_interval devem ser positivos")
+    criteria = [name for name in CRITERIOS_PARADA if ga_kwargs.get(name) is not None]
+    if criteria:
+        raise ValueError(f"O modelo de ilhas não aplica critérios de parada: {', '.join(criteria)}")
+
+    city_names = list(city_names)
+    if isinstance(city_coordinates, np.ndarray):
+        coordinates = np.asarray(city_coordinates, dtype=float)
+    else:
+        coordinates = np.array([city_coordinates[name] for name in city_names], dtype=float)
+    oraculo = criar_oraculo(
+        coordinates,
+        ga_kwargs.get('metric'),
+        ga_kwargs.get('distance_backend', 'auto'),
+        ga_kwargs.get('memory_budget', 512 * 2**20),
+        matrix=ga_kwargs.pop('dist_matrix', None),
+        vectorized_metric=ga_kwargs.get('vectorized_metric', True)
+    )
+    shm, shape, dtype = None, None, None
+    if isinstance(oraculo, MatrizDistancias):
+        dist_matrix = oraculo.matrix
+        shape, dtype = dist_matrix.shape, dist_matrix.dtype
+        shm = shared_memory.SharedMemory(create=True, size=max(dist_matrix.nbytes, 1))
+        shared = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        shared[:] = dist_matrix
+        del shared, dist_matrix
+    del oraculo
+
+    try:
+        ctx = mp.get_context()
+        inboxes = [ctx.Queue() for _ in range(n_islands)]
+        results = ctx.Queue()
+        root_seed = sequencia_sementes(ga_kwargs.pop('seed', None))
+        island_seeds = root_seed.spawn(n_islands)
+        topology_seed = int(root_seed.generate_state(1)[0])
+        workers = [
+            ctx.Process(
+                target=_trabalhador_ilha,
+                args=(island, island_seeds[island], shm.name if shm else None, shape, dtype, city_names,
+                      city_coordinates, ga_kwargs, n_islands, migration_interval,
+                      migration_size, topology, topology_seed, inboxes, results),
+            )
+            for island in range(n_islands)
+        ]
+        for worker in workers:
+            worker.start()
+        try:
+            outcomes = []
+            while len(outcomes) < n_islands:
+                try:
+                    outcomes.append(results.get(timeout=1))
+                except queue.Empty:
+                    # Uma ilha que falhe deixaria as demais esperando migrantes para sempre
+                    if any(worker.exitcode not in (None, 0) for worker in workers):
+                        raise RuntimeError("Uma das ilhas terminou com erro")
+        finally:
+            for worker in workers:
+                if worker.is_alive() and len(outcomes) < n_islands:
+                    worker.terminate()
+                worker.join()
+    finally:
+        if shm:
+            shm.close()
+            shm.unlink()
+
+    _, best_path, best_distance, _ = min(outcomes, key=lambda outcome: outcome[2])
+    return [city_names[i] for i in best_path], best_distance
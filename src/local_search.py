@@ -0,0 +1,219 @@
+from collections import deque
+import numpy as np
+
+# Tolerância para aceitar um movimento como melhoria
+EPSILON = 1e-10
+
+def listas_vizinhos(dist_matrix, k, block_elements=1 << 20):
+    """
+    Calcula, para cada cidade, as k cidades mais próximas em ordem crescente.
+
+    A matriz é percorrida em blocos de linhas, e só cada bloco é copiado: a
+    matriz pode estar em memória compartilhada entre processos ou mapeada de
+    um arquivo, e uma cópia inteira (mais os índices do argpartition)
+    ocuparia cerca de três vezes o seu tamanho.
+
+    Args:
+        dist_matrix (numpy.ndarray): Matriz de distâncias entre as cidades
+        k (int): Número de vizinhos por cidade
+        block_elements (int): Número aproximado de elementos por bloco
+
+    Returns:
+        numpy.ndarray: Vizinhos de cada cidade, formato (n, k)
+    """
+    n = len(dist_matrix)
+    k = min(k, n - 1)
+    if k <= 0:
+        return np.empty((n, 0), dtype=int)
+    neighbors = np.empty((n, k), dtype=int)
+    rows = max(1, block_elements // n)
+    for start in range(0, n, rows):
+        stop = min(start + rows, n)
+        distances = np.array(dist_matrix[start:stop], dtype=float)
+        # Uma cidade não é vizinha de si mesma
+        distances[np.arange(stop - start), np.arange(start, stop)] = np.inf
+        nearest = np.argpartition(distances, k - 1, axis=1)[:, :k]
+        order = np.argsort(np.take_along_axis(distances, nearest, axis=1), axis=1)
+        neighbors[start:stop] = np.take_along_axis(nearest, order, axis=1)
+    return neighbors
+
+def _inverter(tour, positions, start, end):
+    """
+    Inverte o trecho circular tour[start..end] e atualiza as posições.
+
+    Inverter o complemento resulta no mesmo ciclo, então inverte-se o menor
+    dos dois trechos.
+
+    Args:
+        tour (numpy.ndarray): Caminho (alterado in place)
+        positions (numpy.ndarray): Posição de cada cidade no caminho (alterada in place)
+        start (int): Posição inicial do trecho
+        end (int): Posição final do trecho (inclusive)
+    """
+    n = len(tour)
+    length = (end - start) % n + 1
+    if 2 * length > n:
+        start, end = (end + 1) % n, (start - 1) % n
+        length = n - length
+    if length < 2:
+        return
+    indices = (start + np.arange(length)) % n
+    tour[indices] = tour[indices[::-1]]
+    positions[tour[indices]] = indices
+
+def dois_opt(tour, distance, dist_matrix, neighbors, budget, positions=None):
+    """
+    Busca local 2-opt restrita às listas de vizinhos, com don't-look bits.
+
+    Só são testadas arestas (a, c) em que c está entre os vizinhos mais
+    próximos de a; uma cidade volta a ser examinada apenas quando uma de suas
+    arestas muda. Cada movimento é avaliado em tempo constante.
+
+    Args:
+        tour (numpy.ndarray): Caminho a melhorar (alterado in place)
+        distance (float): Distância atual do caminho
+        dist_matrix (numpy.ndarray): Matriz de distâncias entre as cidades
+        neighbors (numpy.ndarray): Listas de vizinhos, formato (n, k)
+        budget (int): Máximo de movimentos avaliados
+        positions (numpy.ndarray): Posição de cada cidade no caminho (opcional)
+
+    Returns:
+        tuple: Nova distância do caminho e número de movimentos avaliados
+    """
+    n = len(tour)
+    if n < 4:
+        return distance, 0
+    if positions is None:
+        positions = np.empty(n, dtype=int)
+        positions[tour] = np.arange(n)
+
+    d = dist_matrix
+    queue = deque(tour.tolist())
+    active = np.ones(n, dtype=bool)
+    evaluations = 0
+    while queue and evaluations < budget:
+        a = queue.popleft()
+        active[a] = False
+        improved = False
+        for forward in (True, False):
+            i = positions[a]
+            b = tour[(i + 1) % n] if forward else tour[i - 1]
+            d_ab = d[a, b]
+            for c in neighbors[a]:
+                d_ac = d[a, c]
+                if d_ac >= d_ab:
+                    break
+                j = positions[c]
+                e = tour[(j + 1) % n] if forward else tour[j - 1]
+                if c == b or e == a:
+                    continue
+                evaluations += 1
+                delta = d_ac + d[b, e] - d_ab - d[c, e]
+                if delta < -EPSILON:
+                    # Troca as arestas (a, b) e (c, e) por (a, c) e (b, e)
+                    if forward:
+                        _inverter(tour, positions, (i + 1) % n, j)
+                    else:
+                        _inverter(tour, positions, i, (j - 1) % n)
+                    distance += delta
+                    for city in (a, b, c, e):
+                        if not active[city]:
+                            active[city] = True
+                            queue.append(city)
+                    improved = True
+                    break
+                if evaluations >= budget:
+                    break
+            if improved or evaluations >= budget:
+                break
+    return distance, evaluations
+
+def _mover_trecho(tour, positions, start, length, anchor, before):
+    """
+    Remove o trecho de length cidades iniciado em start e o reinsere junto
+    da cidade anchor.
+
+    Args:
+        tour (numpy.ndarray): Caminho (alterado in place)
+        positions (numpy.ndarray): Posição de cada cidade (alterada in place)
+        start (int): Posição inicial do trecho
+        length (int): Número de cidades do trecho
+        anchor (int): Cidade que fica adjacente à primeira cidade do trecho
+        before (bool): Se True, o trecho entra antes de anchor, invertido
+            (... s_fim ... s_ini anchor ...); senão entra depois, na mesma ordem
+    """
+    n = len(tour)
+    rotated = np.roll(tour, -(start + length))
+    rest, segment = rotated[:n - length], rotated[n - length:]
+    k = (positions[anchor] - start - length) % n
+    if before:
+        new_tour = np.concatenate((rest[:k], segment[::-1], rest[k:]))
+    else:
+        new_tour = np.concatenate((rest[:k + 1], segment, rest[k + 1:]))
+    tour[:] = new_tour
+    positions[tour] = np.arange(n)
+
+def or_opt(tour, distance, dist_matrix, neighbors, budget, positions=None, max_length=3):
+    """
+    Busca local Or-opt: move trechos de 1 a max_length cidades para junto de
+    um dos vizinhos mais próximos da primeira cidade do trecho.
+
+    Args:
+        tour (numpy.ndarray): Caminho a melhorar (alterado in place)
+        distance (float): Distância atual do caminho
+        dist_matrix (numpy.ndarray): Matriz de distâncias entre as cidades
+        neighbors (numpy.ndarray): Listas de vizinhos, formato (n, k)
+        budget (int): Máximo de movimentos avaliados
+        positions (numpy.ndarray): Posição de cada cidade no caminho (opcional)
+        max_length (int): Tamanho máximo do trecho movido
+
+    Returns:
+        tuple: Nova distância do caminho e número de movimentos avaliados
+    """
+    n = len(tour)
+    if n < 5:
+        return distance, 0
+    if positions is None:
+        positions = np.empty(n, dtype=int)
+        positions[tour] = np.arange(n)
+
+    d = dist_matrix
+    queue = deque(tour.tolist())
+    active = np.ones(n, dtype=bool)
+    evaluations = 0
+    while queue and evaluations < budget:
+        first = queue.popleft()
+        active[first] = False
+        improved = False
+        for length in range(1, max_length + 1):
+            i = positions[first]
+            last = tour[(i + length - 1) % n]
+            prev, nxt = tour[i - 1], tour[(i + length) % n]
+            removal_gain = d[prev, first] + d[last, nxt] - d[prev, nxt]
+            for c in neighbors[first]:
+                d_fc = d[first, c]
+                if d_fc >= removal_gain:
+                    break
+                if (positions[c] - i) % n < length:
+                    continue
+                # Depois de c: c, first ... last, succ(c)  |  antes de c: pred(c), last ... first, c
+                for before in (False, True):
+                    other = tour[positions[c] - 1] if before else tour[(positions[c] + 1) % n]
+                    if (positions[other] - i) % n < length:
+                        continue
+                    evaluations += 1
+                    delta = d_fc + d[last, other] - d[c, other] - removal_gain
+                    if delta < -EPSILON:
+                        _mover_trecho(tour, positions, i, length, c, before)
+                        distance += delta
+                        for city in (first, last, prev, nxt, c, other):
+                            if not active[city]:
+                                active[city] = True
+                                queue.append(city)
+                        improved = True
+                        break
+                if improved or evaluations >= budget:
+                    break
+            if improved or evaluations >= budget:
+                break
+    return distance, evaluations
@@ -0,0 +1,52 @@
+import numpy as np
+
+def sequencia_sementes(seed=None):
+    """
+    Converte uma semente em um numpy.random.SeedSequence.
+
+    Args:
+        seed: None (entropia do sistema), int, sequência de ints,
+            SeedSequence ou numpy.random.Generator
+
+    Returns:
+        numpy.random.SeedSequence: Sequência de sementes correspondente
+    """
+    if isinstance(seed, np.random.SeedSequence):
+        return seed
+    if isinstance(seed, np.random.Generator):
+        # Consome o gerador para derivar a entropia, sem depender de atributos internos
+        return np.random.SeedSequence(seed.integers(2**63, size=4).tolist())
+    return np.random.SeedSequence(seed)
+
+def criar_gerador(seed=None):
+    """
+    Cria o gerador de números aleatórios de uma instância do algoritmo.
+
+    Um Generator recebido é usado diretamente (compartilhando seu estado);
+    as demais formas de semente passam por um SeedSequence.
+
+    Args:
+        seed: None, int, sequência de ints, SeedSequence ou numpy.random.Generator
+
+    Returns:
+        numpy.random.Generator: Gerador de números aleatórios
+    """
+    if isinstance(seed, np.random.Generator):
+        return seed
+    return np.random.default_rng(sequencia_sementes(seed))
+
+def fluxos_independentes(seed, count):
+    """
+    Deriva count sementes independentes para trabalhadores em paralelo.
+
+    Usa SeedSequence.spawn, que garante fluxos estatisticamente independentes
+    e reprodutíveis a partir da mesma semente.
+
+    Args:
+        seed: None, int, sequência de ints, SeedSequence ou numpy.random.Generator
+        count (int): Número de fluxos
+
+    Returns:
+        list: SeedSequence filhas, aceitas como seed por AlgoritmoGenetico
+    """
+    return sequencia_sementes(seed).spawn(count)
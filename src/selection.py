@@ -0,0 +1,78 @@
+import numpy as np
+
+def probabilidades_fitness(distances):
+    """
+    Converte as distâncias dos caminhos em probabilidades de seleção.
+
+    Args:
+        distances (numpy.ndarray): Distância total de cada caminho
+
+    Returns:
+        numpy.ndarray: Probabilidades de fitness (somam 1)
+    """
+    fitness = np.max(distances) - distances
+    fitness_sum = np.sum(fitness)
+
+    return fitness / fitness_sum if fitness_sum != 0 else np.ones(len(distances)) / len(distances)
+
+def selecao_roleta(distances, n_parents, rng):
+    """
+    Seleção por roleta: sorteia todos os pais de uma vez sobre a distribuição
+    acumulada, calculada uma única vez.
+
+    Args:
+        distances (numpy.ndarray): Distância total de cada caminho
+        n_parents (int): Número de pais a selecionar
+        rng (numpy.random.Generator): Gerador de números aleatórios
+
+    Returns:
+        numpy.ndarray: Índices dos pais selecionados
+    """
+    cumulative = probabilidades_fitness(distances).cumsum()
+    indices = np.searchsorted(cumulative, rng.random(n_parents) * cumulative[-1], side='right')
+    return np.minimum(indices, len(distances) - 1)
+
+def selecao_sus(distances, n_parents, rng):
+    """
+    Stochastic universal sampling: um único sorteio posiciona n_parents
+    ponteiros igualmente espaçados sobre a distribuição acumulada.
+
+    Args:
+        distances (numpy.ndarray): Distância total de cada caminho
+        n_parents (int): Número de pais a selecionar
+        rng (numpy.random.Generator): Gerador de números aleatórios
+
+    Returns:
+        numpy.ndarray: Índices dos pais selecionados, em ordem aleatória
+    """
+    cumulative = probabilidades_fitness(distances).cumsum()
+    step = cumulative[-1] / n_parents
+    pointers = rng.random() * step + step * np.arange(n_parents)
+    indices = np.minimum(np.searchsorted(cumulative, pointers, side='right'), len(distances) - 1)
+    # Os ponteiros saem ordenados; embaralha para não formar pares de vizinhos
+    return rng.permutation(indices)
+
+def selecao_torneio(distances, n_parents, rng, tournament_size=3):
+    """
+    Seleção por torneio: sorteia todos os tournament_size x n_parents
+    candidatos de uma vez e escolhe cada vencedor pela menor distância já
+    calculada, sem reavaliar caminhos.
+
+    Args:
+        distances (numpy.ndarray): Distância total de cada caminho
+        n_parents (int): Número de pais a selecionar
+        rng (numpy.random.Generator): Gerador de números aleatórios
+        tournament_size (int): Número de indivíduos em cada torneio
+
+    Returns:
+        numpy.ndarray: Índices dos pais selecionados
+    """
+    candidates = rng.integers(0, len(distances), size=(n_parents, tournament_size))
+    winners = np.argmin(distances[candidates], axis=1)
+    return candidates[np.arange(n_parents), winners]
+
+OPERADORES_SELECAO = {
+    'roulette': selecao_roleta,
+    'sus': selecao_sus,
+    'tournament': selecao_torneio,
+}
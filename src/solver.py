@@ -0,0 +1,40 @@
+import numpy as np
+from .distance_calculator import criar_oraculo
+from .genetic_algorithm import AlgoritmoGenetico
+from .held_karp import held_karp
+
+def resolver_tsp(city_names, city_coordinates, exact_threshold=16, **ga_kwargs):
+    """
+    Resolve o TSP escolhendo o método pelo tamanho da instância.
+
+    Até exact_threshold cidades usa o Held-Karp, exato e, nesses tamanhos,
+    mais rápido que o algoritmo genético (a memória cresce como 2^n n:
+    cerca de 4 MB com 16 cidades e 80 MB com 20). Acima disso, executa o
+    AlgoritmoGenetico com os parâmetros recebidos.
+
+    Args:
+        city_names (list): Nomes das cidades
+        city_coordinates (dict): Coordenadas das cidades (ou array (n, 2) na ordem de city_names)
+        exact_threshold (int): Maior número de cidades resolvido de forma exata
+        **ga_kwargs: Parâmetros do AlgoritmoGenetico; metric e dist_matrix
+            também valem para o método exato
+
+    Returns:
+        tuple: Melhor caminho (nomes das cidades) e menor distância
+    """
+    city_names = list(city_names)
+    if len(city_names) > exact_threshold:
+        return AlgoritmoGenetico(city_names, city_coordinates, **ga_kwargs).run()
+
+    dist_matrix = ga_kwargs.get('dist_matrix')
+    if dist_matrix is None:
+        if isinstance(city_coordinates, np.ndarray):
+            coordinates = np.asarray(city_coordinates, dtype=float)
+        else:
+            coordinates = np.array([city_coordinates[name] for name in city_names], dtype=float)
+        dist_matrix = criar_oraculo(
+            coordinates, ga_kwargs.get('metric'), 'matrix',
+            vectorized_metric=ga_kwargs.get('vectorized_metric', True)
+        ).matrix
+    tour, distance = held_karp(dist_matrix)
+    return [city_names[i] for i in tour], distance
@@ -0,0 +1,268 @@
+import numpy as np
+
+class GradeEspacial:
+    """
+    Índice espacial em grade uniforme sobre um array de coordenadas 2D.
+
+    Os pontos são ordenados pela célula (O(n log n)) e cada coluna da grade
+    ocupa um trecho contínuo dessa ordem, então os pontos de um bloco de
+    células são obtidos com poucos fatiamentos.
+    """
+    def __init__(self, coordinates, points_per_cell=4):
+        """
+        Constrói a grade.
+
+        Args:
+            coordinates (array-like): Coordenadas dos pontos, formato (n, 2)
+            points_per_cell (float): Ocupação média desejada de cada célula
+        """
+        self.coordinates = np.ascontiguousarray(coordinates, dtype=float)
+        n = len(self.coordinates)
+        self.minimum = self.coordinates.min(axis=0)
+        extent = np.maximum(self.coordinates.max(axis=0) - self.minimum, 1e-12)
+        self.cell_size = max(float(np.sqrt(extent[0] * extent[1] * points_per_cell / n)),
+                             float(extent.max()) / max(n, 1), 1e-12)
+        self.shape = np.maximum(np.ceil(extent / self.cell_size).astype(int), 1)
+
+        cells = np.minimum(((self.coordinates - self.minimum) / self.cell_size).astype(int),
+                           self.shape - 1)
+        self.cells = cells
+        keys = cells[:, 0] * self.shape[1] + cells[:, 1]
+        self.order = np.argsort(keys, kind='stable')
+        sorted_keys = keys[self.order]
+        all_keys = np.arange(self.shape[0] * self.shape[1] + 1)
+        self.starts = np.searchsorted(sorted_keys, all_keys)
+
+    def pontos_no_bloco(self, cx, cy, radius):
+        """
+        Retorna os pontos das células a até radius células de (cx, cy).
+
+        Args:
+            cx (int): Coluna da célula central
+            cy (int): Linha da célula central
+            radius (int): Raio do bloco, em células
+
+        Returns:
+            numpy.ndarray: Índices dos pontos no bloco
+        """
+        nx, ny = self.shape
+        y0, y1 = max(cy - radius, 0), min(cy + radius, ny - 1)
+        slices = []
+        for x in range(max(cx - radius, 0), min(cx + radius, nx - 1) + 1):
+            first, last = self.starts[x * ny + y0], self.starts[x * ny + y1 + 1]
+            if last > first:
+                slices.append(self.order[first:last])
+        return np.concatenate(slices) if slices else np.empty(0, dtype=int)
+
+    def k_vizinhos(self, k):
+        """
+        Calcula as listas dos k vizinhos mais próximos de todos os pontos.
+
+        Os pontos de cada célula são processados juntos contra o bloco de
+        células ao redor; o bloco cresce apenas enquanto o k-ésimo vizinho
+        puder estar fora dele, o que garante o resultado exato.
+
+        Args:
+            k (int): Número de vizinhos por ponto
+
+        Returns:
+            numpy.ndarray: Vizinhos de cada ponto em ordem crescente de distância, formato (n, k)
+        """
+        n = len(self.coordinates)
+        k = min(k, n - 1)
+        neighbors = np.empty((n, max(k, 0)), dtype=int)
+        if k <= 0:
+            return neighbors
+
+        ny = self.shape[1]
+        full_radius = int(self.shape.max())
+        for key in np.flatnonzero(np.diff(self.starts)):
+            queries = self.order[self.starts[key]:self.starts[key + 1]]
+            cx, cy = divmod(int(key), ny)
+            radius = 1
+            while True:
+                candidates = self.pontos_no_bloco(cx, cy, radius)
+                if len(candidates) > k:
+                    diff = self.coordinates[queries, np.newaxis, :] - self.coordinates[candidates]
+                    distances = np.sqrt(np.sum(diff ** 2, axis=-1))
+                    distances[queries[:, np.newaxis] == candidates] = np.inf
+                    nearest = np.argpartition(distances, k - 1, axis=1)[:, :k]
+                    nearest_distances = np.take_along_axis(distances, nearest, axis=1)
+                    if radius >= full_radius or nearest_distances.max() <= radius * self.cell_size:
+                        order = np.argsort(nearest_distances, axis=1)
+                        neighbors[queries] = candidates[np.take_along_axis(nearest, order, axis=1)]
+                        break
+                radius += 1
+        return neighbors
+
+    def mais_proximo_disponivel(self, point, excluded):
+        """
+        Busca o ponto disponível mais próximo de point, expandindo o bloco de
+        células até que nenhum ponto fora dele possa ser mais próximo.
+
+        Args:
+            point (int): Índice do ponto de referência
+            excluded (numpy.ndarray): Máscara booleana dos pontos que não podem ser escolhidos
+
+        Returns:
+            int: Índice do ponto disponível mais próximo (-1 se não houver)
+        """
+        cx, cy = self.cells[point]
+        full_radius = int(self.shape.max())
+        best, best_distance = -1, np.inf
+        radius = 1
+        while True:
+            candidates = self.pontos_no_bloco(cx, cy, radius)
+            candidates = candidates[~excluded[candidates]]
+            if len(candidates):
+                diff = self.coordinates[candidates] - self.coordinates[point]
+                squared = np.einsum('ij,ij->i', diff, diff)
+                nearest = int(np.argmin(squared))
+                best, best_distance = int(candidates[nearest]), float(np.sqrt(squared[nearest]))
+            if best_distance <= radius * self.cell_size or radius >= full_radius:
+                return best
+            # Sem candidatos por perto, salta direto para um raio bem maior
+            radius = radius * 2 if best < 0 else radius + 1
+
+def _mais_proximo_restante(coordinates, point, remaining, pares=None):
+    """
+    Busca exaustiva (vetorizada) do ponto restante mais próximo.
+
+    Args:
+        coordinates (numpy.ndarray): Coordenadas dos pontos
+        point (int): Ponto de referência
+        remaining (numpy.ndarray): Índices dos pontos candidatos
+        pares (callable): Distâncias entre cidades, pares(a, b); se None, euclidiana
+
+    Returns:
+        int: Índice do candidato mais próximo
+    """
+    if pares is not None:
+        return int(remaining[np.argmin(pares(np.full(len(remaining), point), remaining))])
+    diff = coordinates[remaining] - coordinates[point]
+    return int(remaining[np.argmin(np.einsum('ij,ij->i', diff, diff))])
+
+def tour_vizinho_mais_proximo(coordinates, neighbors, start=0, grid=None, pares=None):
+    """
+    Constrói um caminho pela heurística do vizinho mais próximo.
+
+    A próxima cidade é procurada primeiro na lista de vizinhos da cidade
+    atual; só quando todos já foram visitados recorre-se à grade espacial
+    (ou, sem grade, a uma busca vetorizada entre as cidades restantes).
+
+    Args:
+        coordinates (numpy.ndarray): Coordenadas das cidades, formato (n, 2)
+        neighbors (numpy.ndarray): Listas de vizinhos mais próximos, formato (n, k)
+        start (int): Cidade inicial
+        grid (GradeEspacial): Índice espacial das cidades (opcional, só para a
+            distância euclidiana)
+        pares (callable): Distâncias entre cidades, pares(a, b), com índices em
+            arrays; se None, distância euclidiana entre as coordenadas
+
+    Returns:
+        numpy.ndarray: Caminho de índices
+    """
+    n = len(coordinates)
+    visited = np.zeros(n, dtype=bool)
+    tour = np.empty(n, dtype=int)
+    remaining = np.arange(n)
+    neighbor_lists = neighbors.tolist()
+    current = start
+    for step in range(n):
+        tour[step] = current
+        visited[current] = True
+        if step == n - 1:
+            break
+        nxt = -1
+        for candidate in neighbor_lists[current]:
+            if not visited[candidate]:
+                nxt = candidate
+                break
+        if nxt < 0 and grid is not None:
+            nxt = grid.mais_proximo_disponivel(current, visited)
+        elif nxt < 0:
+            remaining = remaining[~visited[remaining]]
+            nxt = _mais_proximo_restante(coordinates, current, remaining, pares)
+        current = nxt
+    return tour
+
+def tour_arestas_gulosas(coordinates, neighbors, pares=None):
+    """
+    Constrói um caminho pela heurística gulosa de arestas.
+
+    As arestas candidatas (das listas de vizinhos) são aceitas em ordem
+    crescente de comprimento desde que não criem grau 3 nem ciclo prematuro.
+    Os fragmentos resultantes são ligados pelo extremo livre mais próximo.
+
+    Args:
+        coordinates (numpy.ndarray): Coordenadas das cidades, formato (n, 2)
+        neighbors (numpy.ndarray): Listas de vizinhos mais próximos, formato (n, k)
+        pares (callable): Distâncias entre cidades, pares(a, b), com índices em
+            arrays; se None, distância euclidiana entre as coordenadas
+
+    Returns:
+        numpy.ndarray: Caminho de índices
+    """
+    n = len(coordinates)
+    if n < 3:
+        return np.arange(n)
+
+    k = neighbors.shape[1]
+    edges = np.sort(np.column_stack((np.repeat(np.arange(n), k), neighbors.ravel())), axis=1)
+    edges = np.unique(edges, axis=0)
+    if pares is None:
+        lengths = np.linalg.norm(coordinates[edges[:, 0]] - coordinates[edges[:, 1]], axis=1)
+    else:
+        lengths = pares(edges[:, 0], edges[:, 1])
+    edges = edges[np.argsort(lengths, kind='stable')].tolist()
+
+    parent = list(range(n))
+
+    def raiz(city):
+        while parent[city] != city:
+            parent[city] = parent[parent[city]]
+            city = parent[city]
+        return city
+
+    links = [[] for _ in range(n)]
+    accepted = 0
+    for a, b in edges:
+        if len(links[a]) < 2 and len(links[b]) < 2:
+            root_a, root_b = raiz(a), raiz(b)
+            if root_a != root_b:
+                parent[root_a] = root_b
+                links[a].append(b)
+                links[b].append(a)
+                accepted += 1
+                if accepted == n - 1:
+                    break
+
+    # Percorre os fragmentos, ligando cada extremo ao extremo livre mais próximo
+    visited = np.zeros(n, dtype=bool)
+    endpoints = np.array([city for city in range(n) if len(links[city]) < 2])
+    neighbor_lists = neighbors.tolist()
+    tour = np.empty(n, dtype=int)
+    position = 0
+    current = int(endpoints[0])
+    while True:
+        previous = -1
+        while True:
+            tour[position] = current
+            position += 1
+            visited[current] = True
+            following = [city for city in links[current] if city != previous]
+            if not following or visited[following[0]]:
+                break
+            previous, current = current, following[0]
+        if position == n:
+            break
+        nxt = -1
+        for candidate in neighbor_lists[current]:
+            if not visited[candidate] and len(links[candidate]) < 2:
+                nxt = candidate
+                break
+        if nxt < 0:
+            endpoints = endpoints[~visited[endpoints]]
+            nxt = _mais_proximo_restante(coordinates, current, endpoints, pares)
+        current = nxt
+    return tour
@@ -0,0 +1,342 @@
+import os
+import numpy as np
+
+# Constantes definidas pela documentação do TSPLIB
+PI_TSPLIB = 3.141592
+RAIO_TERRA = 6378.388
+
+def _nint(values):
+    """Arredondamento para o inteiro mais próximo, como o nint do TSPLIB."""
+    return np.floor(values + 0.5)
+
+def distancia_euc_2d(coords_a, coords_b):
+    """
+    Distância EUC_2D: euclidiana arredondada para o inteiro mais próximo.
+
+    Args:
+        coords_a (numpy.ndarray): Coordenadas de origem, formato (..., 2)
+        coords_b (numpy.ndarray): Coordenadas de destino, mesmo formato
+
+    Returns:
+        numpy.ndarray: Distâncias
+    """
+    diff = coords_a - coords_b
+    return _nint(np.sqrt(np.sum(diff * diff, axis=-1)))
+
+def distancia_ceil_2d(coords_a, coords_b):
+    """
+    Distância CEIL_2D: euclidiana arredondada para cima.
+
+    Args:
+        coords_a (numpy.ndarray): Coordenadas de origem, formato (..., 2)
+        coords_b (numpy.ndarray): Coordenadas de destino, mesmo formato
+
+    Returns:
+        numpy.ndarray: Distâncias
+    """
+    diff = coords_a - coords_b
+    return np.ceil(np.sqrt(np.sum(diff * diff, axis=-1)))
+
+def distancia_att(coords_a, coords_b):
+    """
+    Distância ATT (pseudo-euclidiana) usada nas instâncias att48 e att532.
+
+    Args:
+        coords_a (numpy.ndarray): Coordenadas de origem, formato (..., 2)
+        coords_b (numpy.ndarray): Coordenadas de destino, mesmo formato
+
+    Returns:
+        numpy.ndarray: Distâncias
+    """
+    diff = coords_a - coords_b
+    r = np.sqrt(np.sum(diff * diff, axis=-1) / 10.0)
+    t = _nint(r)
+    return np.where(t < r, t + 1, t)
+
+def _radianos_geo(values):
+    """Converte coordenadas GEO (graus.minutos) para radianos."""
+    degrees = np.trunc(values)
+    minutes = values - degrees
+    return PI_TSPLIB * (degrees + 5.0 * minutes / 3.0) / 180.0
+
+def distancia_geo(coords_a, coords_b):
+    """
+    Distância GEO: distância geográfica em km, com coordenadas em graus.minutos.
+
+    Args:
+        coords_a (numpy.ndarray): Latitude e longitude de origem, formato (..., 2)
+        coords_b (numpy.ndarray): Latitude e longitude de destino, mesmo formato
+
+    Returns:
+        numpy.ndarray: Distâncias
+    """
+    rad_a, rad_b = _radianos_geo(coords_a), _radianos_geo(coords_b)
+    q1 = np.cos(rad_a[..., 1] - rad_b[..., 1])
+    q2 = np.cos(rad_a[..., 0] - rad_b[..., 0])
+    q3 = np.cos(rad_a[..., 0] + rad_b[..., 0])
+    argument = np.clip(0.5 * ((1.0 + q1) * q2 - (1.0 - q1) * q3), -1.0, 1.0)
+    distance = np.trunc(RAIO_TERRA * np.arccos(argument) + 1.0)
+    # A distância de uma cidade a ela mesma é zero
+    return np.where(np.all(coords_a == coords_b, axis=-1), 0.0, distance)
+
+METRICAS_TSPLIB = {
+    'EUC_2D': distancia_euc_2d,
+    'CEIL_2D': distancia_ceil_2d,
+    'ATT': distancia_att,
+    'GEO': distancia_geo,
+}
+
+class InstanciaTSP:
+    """
+    Instância do TSPLIB: cabeçalho e coordenadas ou matriz explícita.
+    """
+    def __init__(self, header, coordinates=None, matrix=None):
+        """
+        Args:
+            header (dict): Campos do cabeçalho (NAME, DIMENSION, EDGE_WEIGHT_TYPE, ...)
+            coordinates (numpy.ndarray): Coordenadas das cidades, formato (n, 2)
+            matrix (numpy.ndarray): Matriz explícita de distâncias, formato (n, n)
+        """
+        self.header = header
+        self.name = header.get('NAME', '')
+        self.dimension = int(header['DIMENSION'])
+        self.edge_weight_type = header.get('EDGE_WEIGHT_TYPE', 'EUC_2D')
+        self.coordinates = coordinates
+        self.matrix = matrix
+
+    def metrica(self):
+        """
+        Returns:
+            callable: Métrica vetorizada da instância (None para matriz explícita)
+        """
+        if self.edge_weight_type == 'EXPLICIT':
+            return None
+        if self.edge_weight_type not in METRICAS_TSPLIB:
+            raise ValueError(f"EDGE_WEIGHT_TYPE não suportado: {self.edge_weight_type}")
+        return METRICAS_TSPLIB[self.edge_weight_type]
+
+    def nomes_cidades(self):
+        """
+        Returns:
+            list: Nomes das cidades (numeração 1..n do TSPLIB)
+        """
+        return [str(i + 1) for i in range(self.dimension)]
+
+    def parametros_ga(self):
+        """
+        Monta os argumentos para criar um AlgoritmoGenetico sobre a instância.
+
+        As coordenadas são passadas como array (sem cópia, mesmo quando
+        mapeadas em memória). Matrizes explícitas sem coordenadas de exibição
+        usam coordenadas nulas, relevantes apenas para as heurísticas de
+        construção.
+
+        Returns:
+            dict: city_names, city_coordinates, metric e dist_matrix
+        """
+        coordinates = self.coordinates
+        if coordinates is None:
+            coordinates = np.zeros((self.dimension, 2))
+        return {
+            'city_names': self.nomes_cidades(),
+            'city_coordinates': coordinates,
+            'metric': self.metrica(),
+            'dist_matrix': None if self.matrix is None else np.asarray(self.matrix, dtype=float),
+        }
+
+def _ler_cabecalho(file):
+    """
+    Lê os campos do cabeçalho até a primeira seção de dados.
+
+    Args:
+        file: Arquivo aberto em modo texto
+
+    Returns:
+        tuple: Cabeçalho (dict) e nome da primeira seção (ou None)
+    """
+    header = {}
+    while True:
+        line = file.readline()
+        if not line:
+            return header, None
+        line = line.strip()
+        if not line:
+            continue
+        if ':' in line:
+            key, value = line.split(':', 1)
+            header[key.strip().upper()] = value.strip()
+        elif line.upper() == 'EOF':
+            return header, None
+        else:
+            return header, line.upper()
+
+def _ler_numeros(file, count):
+    """
+    Lê count números das próximas linhas do arquivo, linha a linha.
+
+    Args:
+        file: Arquivo aberto em modo texto
+        count (int): Quantidade de números a ler
+
+    Returns:
+        numpy.ndarray: Números lidos
+    """
+    values = np.empty(count)
+    filled = 0
+    while filled < count:
+        line = file.readline()
+        if not line:
+            raise ValueError("Arquivo TSPLIB terminou antes do fim da seção")
+        numbers = np.array(line.split(), dtype=float)
+        take = min(len(numbers), count - filled)
+        values[filled:filled + take] = numbers[:take]
+        filled += take
+    return values
+
+def _ler_coordenadas(file, dimension):
+    """
+    Lê uma seção de coordenadas (índice, x, y por linha).
+
+    Args:
+        file: Arquivo aberto em modo texto
+        dimension (int): Número de cidades
+
+    Returns:
+        numpy.ndarray: Coordenadas, formato (dimension, 2)
+    """
+    coordinates = np.empty((dimension, 2))
+    for _ in range(dimension):
+        parts = file.readline().split()
+        coordinates[int(parts[0]) - 1] = float(parts[1]), float(parts[2])
+    return coordinates
+
+def _montar_matriz(values, dimension, edge_format):
+    """
+    Monta a matriz completa a partir dos pesos de uma seção EDGE_WEIGHT_SECTION.
+
+    Args:
+        values (numpy.ndarray): Pesos na ordem do arquivo
+        dimension (int): Número de cidades
+        edge_format (str): EDGE_WEIGHT_FORMAT da instância
+
+    Returns:
+        numpy.ndarray: Matriz simétrica, formato (dimension, dimension)
+    """
+    n = dimension
+    if edge_format == 'FULL_MATRIX':
+        return values.reshape(n, n)
+
+    matrix = np.zeros((n, n))
+    if edge_format == 'UPPER_ROW':
+        rows, cols = np.triu_indices(n, 1)
+    elif edge_format == 'LOWER_ROW':
+        rows, cols = np.tril_indices(n, -1)
+    elif edge_format == 'UPPER_DIAG_ROW':
+        rows, cols = np.triu_indices(n)
+    elif edge_format == 'LOWER_DIAG_ROW':
+        rows, cols = np.tril_indices(n)
+    else:
+        raise ValueError(f"EDGE_WEIGHT_FORMAT não suportado: {edge_format}")
+    matrix[rows, cols] = values
+    matrix[cols, rows] = values
+    return matrix
+
+def _quantidade_pesos(dimension, edge_format):
+    """Número de pesos esperados na EDGE_WEIGHT_SECTION."""
+    n = dimension
+    return {
+        'FULL_MATRIX': n * n,
+        'UPPER_ROW': n * (n - 1) // 2,
+        'LOWER_ROW': n * (n - 1) // 2,
+        'UPPER_DIAG_ROW': n * (n + 1) // 2,
+        'LOWER_DIAG_ROW': n * (n + 1) // 2,
+    }[edge_format]
+
+def _arquivo_cache(path, kind):
+    """Caminho do arquivo .npy auxiliar de uma instância."""
+    return f"{path}.{kind}.npy"
+
+def _cache_valido(path, cache_path):
+    """Verifica se o cache existe e é mais novo que o arquivo original."""
+    return os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(path)
+
+def carregar_tsp(path, cache=True):
+    """
+    Carrega uma instância .tsp do TSPLIB.
+
+    O arquivo é lido em streaming, linha a linha. As coordenadas (ou a
+    matriz explícita) são guardadas em um arquivo .npy ao lado do original;
+    nas cargas seguintes apenas o cabeçalho é lido e os dados são mapeados
+    em memória a partir do .npy, sem custo de parsing.
+
+    Suporta EDGE_WEIGHT_TYPE EUC_2D, CEIL_2D, GEO, ATT e EXPLICIT
+    (FULL_MATRIX, UPPER_ROW, LOWER_ROW, UPPER_DIAG_ROW, LOWER_DIAG_ROW).
+
+    Args:
+        path (str): Caminho do arquivo .tsp
+        cache (bool): Se True, lê e grava o cache .npy
+
+    Returns:
+        InstanciaTSP: Instância carregada
+    """
+    coords_cache = _arquivo_cache(path, 'coords')
+    matrix_cache = _arquivo_cache(path, 'matrix')
+    with open(path, encoding='utf-8') as file:
+        header, section = _ler_cabecalho(file)
+        dimension = int(header['DIMENSION'])
+        explicit = header.get('EDGE_WEIGHT_TYPE') == 'EXPLICIT'
+
+        if cache:
+            wanted = matrix_cache if explicit else coords_cache
+            if _cache_valido(path, wanted):
+                data = np.load(wanted, mmap_mode='r')
+                coordinates = None
+                if explicit and _cache_valido(path, coords_cache):
+                    coordinates = np.load(coords_cache, mmap_mode='r')
+                if explicit:
+                    return InstanciaTSP(header, coordinates=coordinates, matrix=data)
+                return InstanciaTSP(header, coordinates=data)
+
+        coordinates, matrix = None, None
+        while section is not None:
+            if section in ('NODE_COORD_SECTION', 'DISPLAY_DATA_SECTION'):
+                coordinates = _ler_coordenadas(file, dimension)
+            elif section == 'EDGE_WEIGHT_SECTION':
+                edge_format = header.get('EDGE_WEIGHT_FORMAT', 'FULL_MATRIX')
+                values = _ler_numeros(file, _quantidade_pesos(dimension, edge_format))
+                matrix = _montar_matriz(values, dimension, edge_format)
+            elif section == 'EOF':
+                break
+            else:
+                raise ValueError(f"Seção TSPLIB não suportada: {section}")
+            _, section = _ler_cabecalho(file)
+
+    if cache:
+        if coordinates is not None:
+            np.save(coords_cache, coordinates)
+        if matrix is not None:
+            np.save(matrix_cache, matrix)
+    return InstanciaTSP(header, coordinates=coordinates, matrix=matrix)
+
+def carregar_tour(path):
+    """
+    Carrega um arquivo .opt.tour (ou .tour) do TSPLIB.
+
+    Args:
+        path (str): Caminho do arquivo
+
+    Returns:
+        numpy.ndarray: Caminho com índices a partir de 0
+    """
+    with open(path, encoding='utf-8') as file:
+        header, section = _ler_cabecalho(file)
+        if section != 'TOUR_SECTION':
+            raise ValueError("Arquivo de tour sem TOUR_SECTION")
+        tour = []
+        for line in file:
+            for token in line.split():
+                city = int(token)
+                if city == -1:
+                    return np.array(tour, dtype=int)
+                tour.append(city - 1)
+    return np.array(tour, dtype=int)
@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+
+from src.genetic_algorithm import AlgoritmoGenetico
+
+def coordenadas(n, seed=0):
+    return np.random.default_rng(seed).random((n, 2)) * 100
+
+@pytest.mark.parametrize('local_search', ['2opt', 'oropt', 'both'])
+def test_busca_local_sem_orcamento_com_deduplicacao(local_search):
+    n = 20
+    ga = AlgoritmoGenetico([str(i) for i in range(n)], coordenadas(n), population_size=30,
+                           generations=5, local_search=local_search, local_search_budget=0, seed=0)
+    path, distance = ga.run()
+    assert sorted(path) == sorted(ga.city_names)
+    assert np.isfinite(distance)
+
+@pytest.mark.parametrize('local_search', ['2opt', 'oropt', 'both'])
+def test_busca_local_com_tres_cidades(local_search):
+    ga = AlgoritmoGenetico(['a', 'b', 'c'], coordenadas(3), population_size=10,
+                           generations=5, local_search=local_search, seed=0)
+    path, distance = ga.run()
+    assert sorted(path) == ['a', 'b', 'c']
+    assert distance == pytest.approx(ga.distancia(np.arange(3)))
+
+def test_orcamento_da_busca_local_vale_para_a_geracao_no_estado_estacionario():
+    n = 60
+    ga = AlgoritmoGenetico([str(i) for i in range(n)], coordenadas(n), population_size=40,
+                           replacement='steady_state', local_search='2opt',
+                           local_search_budget=500, seed=0)
+    ga.iniciar()
+    ga.evoluir_geracao()
+    assert 0 < ga.local_search_evaluations <= 500